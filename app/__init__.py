@@ -8,12 +8,14 @@ from flask import Flask, current_app, g, redirect, render_template, request, ses
 from flask_login import current_user
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
+from app.audit import init_audit_buffer
 from app.blueprints.admin import bp as admin_bp
 from app.blueprints.auth import bp as auth_bp
 from app.blueprints.employee import bp as employee_bp
 from app.blueprints.main import bp as main_bp
 from app.config import Config
 from app.extensions import csrf, db, init_rls_session_listener, login_manager
+from app.tenant import clear_membership_cache
 
 
 TENANT_OPTIONAL_ENDPOINTS = {
@@ -21,6 +23,7 @@ TENANT_OPTIONAL_ENDPOINTS = {
     "auth.logout",
     "auth.select_tenant",
     "main.health",
+    "main.healthz",
     "main.index",
     "static",
 }
@@ -37,6 +40,7 @@ def create_app(config_object: type[Config] = Config) -> Flask:
     login_manager.init_app(app)
     csrf.init_app(app)
     init_rls_session_listener()
+    init_audit_buffer()
 
     # Ensure model metadata is loaded for migrations and tests.
     from app import models as _models  # noqa: F401
@@ -131,6 +135,7 @@ def create_app(config_object: type[Config] = Config) -> Flask:
     def cleanup_session_context(_exc: BaseException | None) -> None:
         db.session.info.pop("tenant_id", None)
         db.session.info.pop("actor_user_id", None)
+        clear_membership_cache()
 
     @app.errorhandler(409)
     def conflict_error(error):
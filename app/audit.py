@@ -7,9 +7,15 @@ from typing import Any
 
 from flask import session
 from flask_login import current_user
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session as OrmSession
 
 from app.extensions import db
-from app.models import AuditLog
+from app.models import AuditLog, now_utc
+
+
+_PENDING_AUDIT_ROWS_KEY = "pending_audit_rows"
+_audit_buffer_registered = False
 
 
 def log_audit(
@@ -33,13 +39,37 @@ def log_audit(
         except ValueError:
             actor_user_id = None
 
-    db.session.add(
-        AuditLog(
-            tenant_id=tenant_uuid,
-            actor_user_id=actor_user_id,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            payload_json=payload or {},
-        )
+    # Tie the buffered row to a transaction so a rollback always discards it.
+    orm_session = db.session()
+    if not orm_session.in_transaction():
+        orm_session.begin()
+    orm_session.info.setdefault(_PENDING_AUDIT_ROWS_KEY, []).append(
+        {
+            "tenant_id": tenant_uuid,
+            "actor_user_id": actor_user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "payload_json": payload or {},
+            "ts": now_utc(),
+        }
     )
+
+
+def init_audit_buffer() -> None:
+    """Write buffered audit rows in one batch when the request transaction commits."""
+    global _audit_buffer_registered
+    if _audit_buffer_registered:
+        return
+
+    @event.listens_for(OrmSession, "before_commit")
+    def flush_audit_rows(orm_session: OrmSession) -> None:
+        rows = orm_session.info.pop(_PENDING_AUDIT_ROWS_KEY, None)
+        if rows:
+            orm_session.execute(insert(AuditLog), rows)
+
+    @event.listens_for(OrmSession, "after_soft_rollback")
+    def discard_audit_rows(orm_session: OrmSession, _previous_transaction: object) -> None:
+        orm_session.info.pop(_PENDING_AUDIT_ROWS_KEY, None)
+
+    _audit_buffer_registered = True
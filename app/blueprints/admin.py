@@ -12,11 +12,24 @@ from urllib.parse import urlparse
 from uuid import UUID
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from flask import Blueprint, abort, current_app, flash, make_response, redirect, render_template, request, send_file, url_for
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    flash,
+    make_response,
+    redirect,
+    render_template,
+    request,
+    send_file,
+    stream_with_context,
+    url_for,
+)
 from flask_login import current_user, login_required
-from email_validator import EmailNotValidError, validate_email
-from sqlalchemy import func, or_, select
+from sqlalchemy import Numeric, Row, String, case, cast, false, func, or_, select
 from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+from sqlalchemy.sql import Select
 
 from app.audit import log_audit
 from app.authorization import (
@@ -64,10 +77,10 @@ from app.models import (
     TimeEventSupersession,
     TimeEventType,
 )
-from app.report_export import to_csv_bytes, to_json_bytes, to_pdf_bytes, to_xlsx_bytes
-from app.security import hash_secret
+from app.report_export import stream_csv_copy, to_csv_bytes, to_json_bytes, to_pdf_bytes, to_xlsx_bytes
+from app.security import hash_pin, hash_secret
 from app.tenant import get_active_tenant_id, tenant_required
-from app.time_events import visible_events_with_employee_between_stmt
+from app.time_events import visible_events_for_report_stmt
 
 
 bp = Blueprint("admin", __name__)
@@ -108,6 +121,16 @@ REPORT_FORMAT_EXTENSIONS = {
     "xlsx": "xlsx",
     "pdf": "pdf",
 }
+CONTROL_REPORT_HEADERS = [
+    "employee_id",
+    "employee_name",
+    "event_id",
+    "timestamp_utc",
+    "timestamp_local",
+    "event_type",
+    "source",
+    "manual",
+]
 IMPORT_PREVIEW_TTL_HOURS = 24
 IMPORT_ALLOWED_HEADERS = {"name", "email", "active", "shift_name", "create_user", "role"}
 IMPORT_REQUIRED_HEADERS = {"name"}
@@ -150,7 +173,7 @@ def _enum_value(value: object, fallback: str = "") -> str:
 
 
 def _tenant_shifts(tenant_id: UUID) -> list[Shift]:
-    return list(db.session.execute(select(Shift).where(Shift.tenant_id == tenant_id).order_by(Shift.name.asc())).scalars().all())
+    return db.session.scalars(select(Shift).where(Shift.tenant_id == tenant_id).order_by(Shift.name.asc())).all()
 
 
 def _shift_leave_policies(shift_id: UUID) -> list[ShiftLeavePolicy]:
@@ -159,7 +182,7 @@ def _shift_leave_policies(shift_id: UUID) -> list[ShiftLeavePolicy]:
         .where(ShiftLeavePolicy.shift_id == shift_id)
         .order_by(ShiftLeavePolicy.created_at.asc(), ShiftLeavePolicy.name.asc())
     )
-    return list(db.session.execute(stmt).scalars().all())
+    return db.session.scalars(stmt).all()
 
 
 def _new_blank_policy_row() -> dict[str, str]:
@@ -358,7 +381,7 @@ def _employee_assignment_rows(employee_id: UUID) -> list[tuple[EmployeeShiftAssi
         .where(EmployeeShiftAssignment.employee_id == employee_id)
         .order_by(EmployeeShiftAssignment.effective_from.desc(), EmployeeShiftAssignment.created_at.desc())
     )
-    return list(db.session.execute(stmt).all())
+    return db.session.execute(stmt).all()
 
 
 def _set_employee_shift_assignment(employee: Employee, shift: Shift, effective_from: date) -> bool:
@@ -429,7 +452,7 @@ def _current_shift_names_by_employee(employee_ids: list[UUID], today: date) -> d
 
 
 def _employee_choices(tenant_id: UUID) -> list[tuple[str, str]]:
-    rows = list(db.session.execute(select(Employee).where(Employee.tenant_id == tenant_id).order_by(Employee.name.asc())).scalars().all())
+    rows = db.session.scalars(select(Employee).where(Employee.tenant_id == tenant_id).order_by(Employee.name.asc())).all()
     return [(str(employee.id), f"{employee.name} ({employee.email or '-'})") for employee in rows]
 
 
@@ -512,7 +535,7 @@ def _attendance_report_employees(tenant_id: UUID, selected_employee_id: UUID | N
     stmt = select(Employee).where(Employee.tenant_id == tenant_id).order_by(Employee.name.asc(), Employee.id.asc())
     if selected_employee_id is not None:
         stmt = stmt.where(Employee.id == selected_employee_id)
-    return list(db.session.execute(stmt).scalars().all())
+    return db.session.scalars(stmt).all()
 
 
 def _attendance_report_events(
@@ -520,30 +543,21 @@ def _attendance_report_events(
     start_utc: datetime,
     end_utc: datetime,
     selected_employee_id: UUID | None,
-) -> list[tuple[TimeEvent, Employee]]:
-    stmt = visible_events_with_employee_between_stmt(start_utc, end_utc).where(TimeEvent.tenant_id == tenant_id)
+) -> list[Row]:
+    stmt = visible_events_for_report_stmt(start_utc, end_utc).where(TimeEvent.tenant_id == tenant_id)
     if selected_employee_id is not None:
         stmt = stmt.where(TimeEvent.employee_id == selected_employee_id)
-    return list(db.session.execute(stmt).all())
+    return db.session.execute(stmt).all()
 
 
-def _build_control_report_rows(event_rows: list[tuple[TimeEvent, Employee]]) -> tuple[list[str], list[list[str]]]:
-    headers = [
-        "employee_id",
-        "employee_name",
-        "event_id",
-        "timestamp_utc",
-        "timestamp_local",
-        "event_type",
-        "source",
-        "manual",
-    ]
+def _build_control_report_rows(event_rows: list[Row]) -> tuple[list[str], list[list[str]]]:
+    headers = list(CONTROL_REPORT_HEADERS)
     rows: list[list[str]] = []
-    for event, employee in event_rows:
+    for event in event_rows:
         rows.append(
             [
-                str(employee.id),
-                employee.name,
+                str(event.employee_id),
+                event.employee_name,
                 str(event.id),
                 _as_utc(event.ts).isoformat(),
                 _to_report_tz(event.ts).strftime("%Y-%m-%d %H:%M:%S"),
@@ -555,9 +569,51 @@ def _build_control_report_rows(event_rows: list[tuple[TimeEvent, Employee]]) ->
     return headers, rows
 
 
-def _worked_minutes_from_events(events: list[TimeEvent]) -> int:
+def _control_report_copy_stmt(
+    tenant_id: UUID,
+    start_utc: datetime,
+    end_utc: datetime,
+    selected_employee_id: UUID | None,
+) -> Select:
+    # The _build_control_report_rows columns, rendered to the same text by PostgreSQL for COPY.
+    utc_ts = func.timezone("UTC", TimeEvent.ts)
+    # Python truthiness of meta_json["manual"]; CASE fixes the order so only numbers reach the cast.
+    manual_type = func.jsonb_typeof(TimeEvent.meta_json["manual"])
+    manual_text = TimeEvent.meta_json["manual"].as_string()
+    manual_truthy = case(
+        (manual_type == "boolean", manual_text == "true"),
+        (manual_type == "number", cast(manual_text, Numeric) != 0),
+        (manual_type == "string", manual_text != ""),
+        (manual_type.in_(("array", "object")), manual_text.not_in(("[]", "{}"))),
+        else_=false(),
+    )
+    stmt = visible_events_for_report_stmt(
+        start_utc,
+        end_utc,
+        columns=(
+            cast(Employee.id, String).label("employee_id"),
+            # COPY quotes empty strings but writes NULL bare, which is what csv.writer does for "".
+            func.nullif(Employee.name, "").label("employee_name"),
+            cast(TimeEvent.id, String).label("event_id"),
+            (
+                func.to_char(utc_ts, 'YYYY-MM-DD"T"HH24:MI:SS')
+                + case((func.date_trunc("second", utc_ts) == utc_ts, ""), else_=func.to_char(utc_ts, ".US"))
+                + "+00:00"
+            ).label("timestamp_utc"),
+            func.to_char(func.timezone(str(_report_timezone()), TimeEvent.ts), "YYYY-MM-DD HH24:MI:SS").label("timestamp_local"),
+            cast(TimeEvent.type, String).label("event_type"),
+            cast(TimeEvent.source, String).label("source"),
+            case((manual_truthy, "yes"), else_="no").label("manual"),
+        ),
+    ).where(TimeEvent.tenant_id == tenant_id)
+    if selected_employee_id is not None:
+        stmt = stmt.where(TimeEvent.employee_id == selected_employee_id)
+    return stmt
+
+
+def _worked_minutes_from_events(events: list[Row]) -> int:
     worked_minutes = 0
-    open_entry: TimeEvent | None = None
+    open_entry: Row | None = None
 
     for event in sorted(events, key=lambda row: _as_utc(row.ts)):
         if event.type == TimeEventType.IN:
@@ -575,7 +631,7 @@ def _worked_minutes_from_events(events: list[TimeEvent]) -> int:
 
 def _build_executive_report_rows(
     employees: list[Employee],
-    event_rows: list[tuple[TimeEvent, Employee]],
+    event_rows: list[Row],
 ) -> tuple[list[str], list[list[str | int]]]:
     headers = [
         "employee_id",
@@ -591,7 +647,7 @@ def _build_executive_report_rows(
         "last_event_local",
     ]
     stats_by_employee: dict[UUID, dict[str, object]] = {}
-    events_by_employee_day: dict[UUID, dict[date, list[TimeEvent]]] = {}
+    events_by_employee_day: dict[UUID, dict[date, list[Row]]] = {}
 
     for employee in employees:
         stats_by_employee[employee.id] = {
@@ -605,11 +661,11 @@ def _build_executive_report_rows(
         }
         events_by_employee_day[employee.id] = {}
 
-    for event, employee in event_rows:
+    for event in event_rows:
         stats = stats_by_employee.setdefault(
-            employee.id,
+            event.employee_id,
             {
-                "employee_name": employee.name,
+                "employee_name": event.employee_name,
                 "total_events": 0,
                 "in_events": 0,
                 "out_events": 0,
@@ -634,7 +690,7 @@ def _build_executive_report_rows(
         if last_event_local is None or local_ts > last_event_local:
             stats["last_event_local"] = local_ts
 
-        daily_events = events_by_employee_day.setdefault(employee.id, {})
+        daily_events = events_by_employee_day.setdefault(event.employee_id, {})
         daily_events.setdefault(local_ts.date(), []).append(event)
 
     rows: list[list[str | int]] = []
@@ -723,16 +779,26 @@ def _parse_import_bool(
 
 
 def _tenant_shift_by_name(tenant_id: UUID) -> dict[str, Shift]:
-    shifts = list(db.session.execute(select(Shift).where(Shift.tenant_id == tenant_id)).scalars().all())
+    shifts = db.session.scalars(select(Shift).where(Shift.tenant_id == tenant_id)).all()
     return {shift.name.strip().lower(): shift for shift in shifts}
 
 
+def _import_cell(csv_row: list[str], column_index: dict[str, int], field_name: str) -> str:
+    index = column_index.get(field_name)
+    if index is None or index >= len(csv_row):
+        return ""
+    return csv_row[index].strip()
+
+
 def _build_import_preview(
     tenant_id: UUID,
     *,
     filename: str,
     payload: bytes,
 ) -> tuple[list[dict[str, object]], list[dict[str, object]], dict[str, int], str]:
+    # Imported lazily: email_validator is heavy and only the CSV import needs it directly.
+    from email_validator import EmailNotValidError, validate_email
+
     if not payload:
         raise ValueError("El archivo CSV esta vacio.")
 
@@ -749,12 +815,13 @@ def _build_import_preview(
     if not decoded_csv.strip():
         raise ValueError("El archivo CSV esta vacio.")
 
-    reader = csv.DictReader(io.StringIO(decoded_csv))
-    if reader.fieldnames is None:
+    reader = csv.reader(io.StringIO(decoded_csv))
+    fieldnames = next(reader, None)
+    if fieldnames is None:
         raise ValueError("CSV invalido: faltan encabezados.")
 
     header_map: dict[str, str] = {}
-    for header in reader.fieldnames:
+    for header in fieldnames:
         normalized = (header or "").strip().lower()
         if not normalized:
             continue
@@ -764,23 +831,21 @@ def _build_import_preview(
     if missing_headers:
         raise ValueError("El CSV debe incluir la columna obligatoria 'name'.")
 
+    # Resolve column positions once; a repeated header keeps its last column, as DictReader did.
+    last_index_by_header = {header: index for index, header in enumerate(fieldnames)}
+    column_index = {normalized: last_index_by_header[header] for normalized, header in header_map.items()}
+
     shift_by_name = _tenant_shift_by_name(tenant_id)
     rows: list[dict[str, object]] = []
     error_map: dict[int, list[str]] = {}
 
-    for row_number, csv_row in enumerate(reader, start=2):
-        def _raw_value(field_name: str) -> str:
-            key = header_map.get(field_name)
-            if key is None:
-                return ""
-            return (csv_row.get(key, "") or "").strip()
-
-        name = _raw_value("name")
-        email_raw = _raw_value("email").lower()
-        active_raw = _raw_value("active")
-        shift_name = _raw_value("shift_name")
-        create_user_raw = _raw_value("create_user")
-        role_raw = _raw_value("role").upper()
+    for row_number, csv_row in enumerate((row for row in reader if row), start=2):
+        name = _import_cell(csv_row, column_index, "name")
+        email_raw = _import_cell(csv_row, column_index, "email").lower()
+        active_raw = _import_cell(csv_row, column_index, "active")
+        shift_name = _import_cell(csv_row, column_index, "shift_name")
+        create_user_raw = _import_cell(csv_row, column_index, "create_user")
+        role_raw = _import_cell(csv_row, column_index, "role").upper()
 
         create_user = _parse_import_bool(
             create_user_raw,
@@ -1077,7 +1142,7 @@ def _refresh_import_job_status(import_job: ImportJob) -> bool:
 
 
 def _team_health_counts(tenant_id: UUID) -> dict[str, int]:
-    employees = list(db.session.execute(select(Employee).where(Employee.tenant_id == tenant_id)).scalars().all())
+    employees = db.session.scalars(select(Employee).where(Employee.tenant_id == tenant_id)).all()
     employee_ids = [employee.id for employee in employees]
     active_employee_ids = [employee.id for employee in employees if employee.active]
 
@@ -1189,7 +1254,7 @@ def users_new():
         abort(400, description="No active tenant selected.")
 
     form = UserCreateForm()
-    form.employee_id.choices = [("", "Sin empleado")] + _employee_choices(tenant_id)
+    form.employee_id.choices_loader = lambda: [("", "Sin empleado")] + _employee_choices(tenant_id)
 
     if form.validate_on_submit():
         normalized_email = form.email.data.strip().lower()
@@ -1280,7 +1345,7 @@ def users_edit(user_id: UUID):
         abort(403, description="Insufficient permissions.")
 
     form = UserEditForm()
-    form.employee_id.choices = [("", "Sin empleado")] + _employee_choices(tenant_id)
+    form.employee_id.choices_loader = lambda: [("", "Sin empleado")] + _employee_choices(tenant_id)
 
     if request.method == "GET":
         form.role.data = membership.role.value
@@ -1420,9 +1485,7 @@ def employees_list():
 
     active_filter = (request.args.get("filter") or "").strip().lower()
     filter_label = ""
-    employees = list(
-        db.session.execute(select(Employee).where(Employee.tenant_id == tenant_id).order_by(Employee.name.asc())).scalars().all()
-    )
+    employees = db.session.scalars(select(Employee).where(Employee.tenant_id == tenant_id).order_by(Employee.name.asc())).all()
     filtered_employees = employees
     current_shift_by_employee: dict[UUID, str] = {}
     shift_lookup_available = True
@@ -1502,7 +1565,7 @@ def employees_new():
             tenant_id=tenant_id,
             name=form.name.data.strip(),
             email=form.email.data.strip().lower() if form.email.data else None,
-            pin_hash=hash_secret(form.pin.data) if form.pin.data else None,
+            pin_hash=hash_pin(form.pin.data) if form.pin.data else None,
             active=form.active.data,
         )
         db.session.add(employee)
@@ -1515,7 +1578,7 @@ def employees_new():
         )
         db.session.commit()
         flash("Employee created.", "success")
-        return redirect(url_for("admin.employees_list"))
+        return redirect(url_for("admin.employees_edit", employee_id=employee.id))
     return render_template("admin/employee_new.html", form=form)
 
 
@@ -1535,7 +1598,7 @@ def employees_edit(employee_id: UUID):
         abort(404)
 
     form = EmployeeEditForm()
-    form.punch_approver_user_id.choices = _punch_approver_choices(tenant_id)
+    form.punch_approver_user_id.choices_loader = lambda: _punch_approver_choices(tenant_id)
 
     tenant_shifts: list[Shift] = []
     shifts_available = True
@@ -1646,7 +1709,7 @@ def employees_edit(employee_id: UUID):
         employee.punch_approver_user_id = selected_approver_user_id
 
         if form.pin.data:
-            employee.pin_hash = hash_secret(form.pin.data)
+            employee.pin_hash = hash_pin(form.pin.data)
 
         shift_payload: dict[str, str] | None = None
         if form.assignment_shift_id.data:
@@ -2163,7 +2226,7 @@ def shifts():
 
 def _render_turnos():
     try:
-        rows = list(db.session.execute(select(Shift).order_by(Shift.name.asc())).scalars().all())
+        rows = db.session.scalars(select(Shift).order_by(Shift.name.asc())).all()
     except (OperationalError, ProgrammingError, LookupError):
         db.session.rollback()
         current_app.logger.warning(
@@ -2829,7 +2892,7 @@ def payroll_report():
         abort(400, description="No active tenant selected.")
 
     form = AttendanceReportForm()
-    form.employee_id.choices = [("", "Todos los empleados")] + _employee_choices(tenant_id)
+    form.employee_id.choices_loader = lambda: [("", "Todos los empleados")] + _employee_choices(tenant_id)
     return render_template("admin/payroll.html", form=form)
 
 
@@ -2843,7 +2906,7 @@ def payroll_export():
         abort(400, description="No active tenant selected.")
 
     form = AttendanceReportForm()
-    form.employee_id.choices = [("", "Todos los empleados")] + _employee_choices(tenant_id)
+    form.employee_id.choices_loader = lambda: [("", "Todos los empleados")] + _employee_choices(tenant_id)
     if not form.validate_on_submit():
         flash("Revisa los datos del reporte.", "danger")
         return render_template("admin/payroll.html", form=form), 400
@@ -2868,6 +2931,15 @@ def payroll_export():
         abort(404, description="Empleado no encontrado para el tenant actual.")
 
     start_utc, end_utc = _report_window_utc(form.date_from.data, form.date_to.data)
+    download_name = _report_download_filename(report_type, output_format, form.date_from.data, form.date_to.data, selected_employee_id)
+    if report_type == "control" and output_format == "csv" and db.session.get_bind().dialect.name == "postgresql":
+        copy_stmt = _control_report_copy_stmt(tenant_id, start_utc, end_utc, selected_employee_id)
+        return Response(
+            stream_with_context(stream_csv_copy(db.session.connection(), copy_stmt, CONTROL_REPORT_HEADERS)),
+            content_type=REPORT_FORMAT_CONTENT_TYPES[output_format],
+            headers={"Content-Disposition": f'attachment; filename="{download_name}"'},
+        )
+
     event_rows = _attendance_report_events(tenant_id, start_utc, end_utc, selected_employee_id)
 
     if report_type == "control":
@@ -2902,9 +2974,7 @@ def payroll_export():
 
     response = make_response(payload)
     response.headers["Content-Type"] = REPORT_FORMAT_CONTENT_TYPES[output_format]
-    response.headers["Content-Disposition"] = (
-        f'attachment; filename="{_report_download_filename(report_type, output_format, form.date_from.data, form.date_to.data, selected_employee_id)}"'
-    )
+    response.headers["Content-Disposition"] = f'attachment; filename="{download_name}"'
     return response
 
 
@@ -2913,7 +2983,5 @@ def payroll_export():
 @tenant_required
 @view_adjustments_required
 def adjustments_stub():
-    rows = list(
-        db.session.execute(select(TimeAdjustment).order_by(TimeAdjustment.created_at.desc()).limit(20)).scalars().all()
-    )
+    rows = db.session.scalars(select(TimeAdjustment).order_by(TimeAdjustment.created_at.desc()).limit(20)).all()
     return render_template("admin/adjustments.html", rows=rows)
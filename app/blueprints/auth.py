@@ -11,8 +11,8 @@ from sqlalchemy import select
 from app.extensions import db
 from app.forms import LoginForm, PasswordChangeForm, TenantSelectForm
 from app.models import Membership, Tenant, User
-from app.tenant import landing_endpoint_for_membership
-from app.security import hash_secret, verify_secret
+from app.tenant import clear_membership_cache, landing_endpoint_for_membership
+from app.security import hash_secret, secret_needs_rehash, verify_secret
 
 
 bp = Blueprint("auth", __name__)
@@ -47,6 +47,10 @@ def login():
             flash("User is inactive.", "warning")
             return render_template("auth/login.html", form=form), 403
 
+        if secret_needs_rehash(user.password_hash):
+            user.password_hash = hash_secret(form.password.data)
+            db.session.commit()
+
         login_user(user, remember=form.remember.data)
         session.pop("active_tenant_id", None)
 
@@ -60,6 +64,7 @@ def login():
         if len(memberships) == 1:
             membership = memberships[0]
             session["active_tenant_id"] = str(membership.tenant_id)
+            clear_membership_cache()
             return redirect(url_for(landing_endpoint_for_membership(membership)))
 
         next_url = request.args.get("next")
@@ -125,6 +130,7 @@ def select_tenant():
     if request.method == "GET" and len(membership_rows) == 1:
         membership = membership_rows[0][0]
         session["active_tenant_id"] = str(membership.tenant_id)
+        clear_membership_cache()
         return redirect(url_for(landing_endpoint_for_membership(membership)))
 
     if form.validate_on_submit():
@@ -134,6 +140,7 @@ def select_tenant():
             return render_template("auth/select_tenant.html", form=form, memberships=membership_rows), 403
 
         session["active_tenant_id"] = form.tenant_id.data
+        clear_membership_cache()
         chosen_membership = next((membership for membership, _ in membership_rows if str(membership.tenant_id) == form.tenant_id.data), None)
         return redirect(url_for(landing_endpoint_for_membership(chosen_membership)))
 
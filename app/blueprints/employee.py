@@ -55,10 +55,10 @@ ACTION_MAP = {
 }
 
 
-PUNCH_BUTTONS = [
-    {"slug": "in", "label": "Registrar ENTRADA", "class": "in"},
-    {"slug": "out", "label": "Registrar SALIDA", "class": "out"},
-]
+PUNCH_BUTTONS = (
+    {"slug": "in", "label": "Registrar Entrada", "class": "in"},
+    {"slug": "out", "label": "Registrar Salida", "class": "out"},
+)
 
 SHIFT_FREQUENCY_LABELS = {
     ExpectedHoursFrequency.YEARLY: "Anuales",
@@ -82,14 +82,15 @@ PUNCH_CORRECTION_STATUS_LABELS = {
     PunchCorrectionStatus.REJECTED: "Rechazada",
     PunchCorrectionStatus.CANCELLED: "Cancelada",
 }
-HOURS_PERIOD_OPTIONS = [
+HOURS_PERIOD_OPTIONS = (
     {"value": "day", "label": "Dia"},
     {"value": "week", "label": "Semana"},
     {"value": "month", "label": "Mes"},
     {"value": "year", "label": "Ano"},
     {"value": "custom", "label": "Rango"},
-]
-HOURS_PERIOD_PRESETS = {"day", "week", "month", "year"}
+)
+HOURS_PERIOD_PRESETS = frozenset({"day", "week", "month", "year"})
+CALENDAR_WEEKDAY_LABELS = ("L", "M", "X", "J", "V", "S", "D")
 REQUEST_ATTACHMENT_ALLOWED_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png", ".webp"}
 REQUEST_ATTACHMENT_ALLOWED_MIME = {"application/pdf", "image/jpeg", "image/png", "image/webp"}
 REQUEST_ATTACHMENT_MAX_BYTES = 5 * 1024 * 1024
@@ -130,7 +131,7 @@ def _employee_for_current_user() -> Employee:
 def _todays_events(employee_id: uuid.UUID) -> list[TimeEvent]:
     start, end = _today_bounds_utc()
     stmt = visible_employee_events_between_stmt(employee_id, start, end)
-    return list(db.session.execute(stmt).scalars().all())
+    return db.session.scalars(stmt).all()
 
 
 def _current_presence_state(events: list[TimeEvent]) -> str:
@@ -413,7 +414,7 @@ def _hours_calendar_payload(
 
     return {
         "month_label": first_day.strftime("%B %Y"),
-        "weekdays": ["L", "M", "X", "J", "V", "S", "D"],
+        "weekdays": CALENDAR_WEEKDAY_LABELS,
         "weeks": [cells[index : index + 7] for index in range(0, len(cells), 7)],
     }
 
@@ -428,7 +429,7 @@ def _build_hours_payload(employee: Employee, args) -> dict[str, object]:
 
     start_utc, end_utc = _date_range_bounds_utc(start_day, end_day)
     events_stmt = visible_employee_events_between_stmt(employee.id, start_utc, end_utc)
-    period_events = list(db.session.execute(events_stmt).scalars().all())
+    period_events = db.session.scalars(events_stmt).all()
 
     events_by_day: dict[date, list[TimeEvent]] = {}
     for event in period_events:
@@ -531,7 +532,7 @@ def _employee_shift_assignments(
         .order_by(EmployeeShiftAssignment.effective_from.asc(), EmployeeShiftAssignment.created_at.asc())
     )
     try:
-        return list(db.session.execute(stmt).all())
+        return db.session.execute(stmt).all()
     except (OperationalError, ProgrammingError, LookupError):
         db.session.rollback()
         current_app.logger.warning(
@@ -594,7 +595,7 @@ def _policy_consumption_by_employee(
         .order_by(LeaveRequest.created_at.asc())
     )
     try:
-        rows = list(db.session.execute(stmt).scalars().all())
+        rows = db.session.scalars(stmt).all()
     except (OperationalError, ProgrammingError, LookupError):
         db.session.rollback()
         current_app.logger.warning(
@@ -632,7 +633,7 @@ def _active_leave_policies_for_shift(shift: Shift | None, current_day: date) ->
         .order_by(ShiftLeavePolicy.name.asc(), ShiftLeavePolicy.created_at.asc())
     )
     try:
-        return list(db.session.execute(stmt).scalars().all())
+        return db.session.scalars(stmt).all()
     except (OperationalError, ProgrammingError, LookupError):
         db.session.rollback()
         current_app.logger.warning(
@@ -686,7 +687,7 @@ def _work_balance_summary(employee: Employee, current_day: date) -> dict[str, st
     month_start_utc, _ = _month_bounds_utc(current_day.year, current_day.month)
     day_end_utc = datetime.combine(current_day, time.max, tzinfo=_app_timezone()).astimezone(timezone.utc)
     month_events_stmt = visible_employee_events_between_stmt(employee.id, month_start_utc, day_end_utc)
-    month_events = list(db.session.execute(month_events_stmt).scalars().all())
+    month_events = db.session.scalars(month_events_stmt).all()
     events_by_day: dict[date, list[TimeEvent]] = {}
     for event in month_events:
         events_by_day.setdefault(_to_app_tz(event.ts).date(), []).append(event)
@@ -1080,7 +1081,7 @@ def punch_action(action: str):
 def me_events():
     employee = _employee_for_current_user()
     stmt = visible_employee_recent_events_stmt(employee.id, 100)
-    events = list(db.session.execute(stmt).scalars().all())
+    events = db.session.scalars(stmt).all()
     return render_template("employee/events.html", employee=employee, events=events)
 
 
@@ -1360,7 +1361,7 @@ def presence_control():
 
     month_start, month_end = _month_bounds_utc(selected_year, selected_month)
     month_events_stmt = visible_employee_events_between_stmt(employee.id, month_start, month_end)
-    month_events = list(db.session.execute(month_events_stmt).scalars().all())
+    month_events = db.session.scalars(month_events_stmt).all()
     events_by_day: dict[date, list[TimeEvent]] = {}
     for event in month_events:
         events_by_day.setdefault(_to_app_tz(event.ts).date(), []).append(event)
@@ -1437,7 +1438,7 @@ def presence_control():
         )
 
     recent_stmt = visible_employee_recent_events_stmt(employee.id, 12)
-    recent_events = list(db.session.execute(recent_stmt).scalars().all())
+    recent_events = db.session.scalars(recent_stmt).all()
     correction_rows_stmt = (
         select(PunchCorrectionRequest, TimeEvent)
         .join(TimeEvent, TimeEvent.id == PunchCorrectionRequest.source_event_id)
@@ -1507,7 +1508,7 @@ def pause_control():
 
     month_start, month_end = _month_bounds_utc(selected_year, selected_month)
     month_events_stmt = visible_employee_events_between_stmt(employee.id, month_start, month_end)
-    month_events = list(db.session.execute(month_events_stmt).scalars().all())
+    month_events = db.session.scalars(month_events_stmt).all()
     events_by_day: dict[date, list[TimeEvent]] = {}
     for event in month_events:
         events_by_day.setdefault(_to_app_tz(event.ts).date(), []).append(event)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, redirect, session, url_for
+from flask import Blueprint, current_app, redirect, session, url_for
 from flask_login import current_user
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
 
+from app.extensions import db
 from app.tenant import current_membership, landing_endpoint_for_membership
 
 bp = Blueprint("main", __name__)
@@ -23,3 +26,13 @@ def index():
 def health():
     return {"status": "ok"}, 200
 
+
+@bp.get("/healthz")
+def healthz():
+    try:
+        db.session.execute(text("SELECT 1"))
+    except (OperationalError, PoolTimeoutError):
+        db.session.rollback()
+        current_app.logger.warning("Database health check failed.", exc_info=True)
+        return {"status": "unavailable"}, 503
+    return {"status": "ok"}, 200
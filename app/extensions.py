@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import uuid
 
 from flask import redirect, request, url_for
@@ -21,6 +22,7 @@ login_manager.login_view = "auth.login"
 login_manager.login_message_category = "warning"
 
 _rls_listener_registered = False
+_CANONICAL_UUID_RE = re.compile(r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z")
 
 
 @login_manager.unauthorized_handler
@@ -31,6 +33,10 @@ def handle_unauthorized() -> str:
 def _safe_uuid(value: object) -> str | None:
     if value is None:
         return None
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, str) and _CANONICAL_UUID_RE.match(value):
+        return value
     try:
         return str(uuid.UUID(str(value)))
     except ValueError:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from datetime import date
-from uuid import UUID
+from functools import lru_cache
+import re
+from typing import Callable
 
 from flask_wtf import FlaskForm
 from flask_wtf.file import FileField
@@ -21,53 +23,99 @@ from wtforms import (
 from wtforms.validators import DataRequired, Email, InputRequired, Length, NumberRange, Optional, ValidationError
 
 
+_UUID_RE = re.compile(r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.IGNORECASE)
+_ALLOWED_ROLES = frozenset({"OWNER", "ADMIN", "MANAGER", "EMPLOYEE"})
+_EMAIL_SHAPE_RE = re.compile(r"\A[^@\s]+@[^@\s]+\.[^@\s]+\Z")
+
+
+class FastEmail(Email):
+    # Reject obviously malformed input before handing off to the full email_validator parser.
+    def __call__(self, form, field) -> None:
+        value = field.data
+        if not value or len(value) > 255 or not _EMAIL_SHAPE_RE.match(value):
+            raise ValidationError(self.message or field.gettext("Invalid email address."))
+        super().__call__(form, field)
+
+
+# Validators are stateless, so fields share these instances instead of building their own.
+_DATA_REQUIRED = DataRequired()
+_INPUT_REQUIRED = InputRequired()
+_OPTIONAL = Optional()
+_EMAIL = FastEmail()
+_MAX_LENGTH_255 = Length(max=255)
+_MAX_LENGTH_64 = Length(max=64)
+_PASSWORD_LENGTH = Length(min=8, max=255)
+_PIN_LENGTH = Length(min=4, max=16)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_uuid(value: str) -> bool:
+    return _UUID_RE.match(value) is not None
+
+
+class LazyChoiceField(SelectField):
+    def __init__(self, *args, choices_loader: Callable[[], list[tuple[str, str]]] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.choices_loader = choices_loader
+
+    @property
+    def choices(self) -> list[tuple[str, str]] | None:
+        if self._choices is None and self.choices_loader is not None:
+            self._choices = list(self.choices_loader())
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: list[tuple[str, str]] | None) -> None:
+        self._choices = value
+
+
 class LoginForm(FlaskForm):
-    email = StringField("Email", validators=[DataRequired(), Email(), Length(max=255)], filters=[lambda value: value.strip() if value else value])
-    password = PasswordField("Password", validators=[DataRequired(), Length(min=8, max=255)])
+    email = StringField("Email", validators=(_DATA_REQUIRED, _EMAIL, _MAX_LENGTH_255), default="", filters=(str.strip,))
+    password = PasswordField("Password", validators=(_DATA_REQUIRED, _PASSWORD_LENGTH))
     remember = BooleanField("Remember me")
     submit = SubmitField("Sign in")
 
 
 class TenantSelectForm(FlaskForm):
-    tenant_id = SelectField("Tenant", choices=[], validators=[DataRequired()], coerce=str)
+    tenant_id = SelectField("Tenant", choices=[], validators=(_DATA_REQUIRED,), coerce=str)
     submit = SubmitField("Use tenant")
 
 
 class PasswordChangeForm(FlaskForm):
-    current_password = PasswordField("Contraseña actual", validators=[DataRequired(), Length(min=8, max=255)])
-    new_password = PasswordField("Nueva contraseña", validators=[DataRequired(), Length(min=8, max=255)])
-    confirm_password = PasswordField("Confirmar nueva contraseña", validators=[DataRequired(), Length(min=8, max=255)])
+    current_password = PasswordField("Contraseña actual", validators=(_DATA_REQUIRED, _PASSWORD_LENGTH))
+    new_password = PasswordField("Nueva contraseña", validators=(_DATA_REQUIRED, _PASSWORD_LENGTH))
+    confirm_password = PasswordField("Confirmar nueva contraseña", validators=(_DATA_REQUIRED, _PASSWORD_LENGTH))
     submit = SubmitField("Actualizar contraseña")
 
 
 class AdminResetPasswordForm(FlaskForm):
-    temporary_password = PasswordField("Contraseña temporal", validators=[DataRequired(), Length(min=8, max=255)])
+    temporary_password = PasswordField("Contraseña temporal", validators=(_DATA_REQUIRED, _PASSWORD_LENGTH))
     submit = SubmitField("Resetear contraseña")
 
 
 class EmployeeCreateForm(FlaskForm):
-    name = StringField("Name", validators=[DataRequired(), Length(max=255)])
-    email = StringField("Email", validators=[Optional(), Email(), Length(max=255)])
-    pin = PasswordField("PIN", validators=[Optional(), Length(min=4, max=16)])
+    name = StringField("Name", validators=(_DATA_REQUIRED, _MAX_LENGTH_255))
+    email = StringField("Email", validators=(_OPTIONAL, _EMAIL, _MAX_LENGTH_255))
+    pin = PasswordField("PIN", validators=(_OPTIONAL, _PIN_LENGTH))
     active = BooleanField("Active", default=True)
     submit = SubmitField("Create employee")
 
 
 class EmployeeEditForm(FlaskForm):
-    name = StringField("Name", validators=[DataRequired(), Length(max=255)])
-    email = StringField("Email", validators=[Optional(), Email(), Length(max=255)])
-    pin = PasswordField("New PIN (optional)", validators=[Optional(), Length(min=4, max=16)])
+    name = StringField("Name", validators=(_DATA_REQUIRED, _MAX_LENGTH_255))
+    email = StringField("Email", validators=(_OPTIONAL, _EMAIL, _MAX_LENGTH_255))
+    pin = PasswordField("New PIN (optional)", validators=(_OPTIONAL, _PIN_LENGTH))
     active = BooleanField("Active", default=True)
-    assignment_shift_id = SelectField("Asignar turno", choices=[], validators=[Optional()], default="", coerce=str)
-    punch_approver_user_id = SelectField("Aprobador de rectificaciones", choices=[], validators=[Optional()], default="", coerce=str)
-    assignment_effective_from = DateField("Aplicar desde", validators=[Optional()], default=date.today)
+    assignment_shift_id = SelectField("Asignar turno", choices=[], validators=(_OPTIONAL,), default="", coerce=str)
+    punch_approver_user_id = LazyChoiceField("Aprobador de rectificaciones", validators=(_OPTIONAL,), default="", coerce=str)
+    assignment_effective_from = DateField("Aplicar desde", validators=(_OPTIONAL,), default=date.today)
     submit = SubmitField("Guardar cambios")
 
 
 class UserCreateForm(FlaskForm):
-    email = StringField("Email", validators=[DataRequired(), Email(), Length(max=255)], filters=[lambda value: value.strip() if value else value])
-    password = PasswordField("Password", validators=[DataRequired(), Length(min=8, max=255)])
-    confirm_password = PasswordField("Confirm password", validators=[DataRequired(), Length(min=8, max=255)])
+    email = StringField("Email", validators=(_DATA_REQUIRED, _EMAIL, _MAX_LENGTH_255), default="", filters=(str.strip,))
+    password = PasswordField("Password", validators=(_DATA_REQUIRED, _PASSWORD_LENGTH))
+    confirm_password = PasswordField("Confirm password", validators=(_DATA_REQUIRED, _PASSWORD_LENGTH))
     role = SelectField(
         "Role",
         choices=[
@@ -76,10 +124,10 @@ class UserCreateForm(FlaskForm):
             ("MANAGER", "Manager"),
             ("EMPLOYEE", "Employee"),
         ],
-        validators=[DataRequired()],
+        validators=(_DATA_REQUIRED,),
         default="EMPLOYEE",
     )
-    employee_id = SelectField("Employee", choices=[], validators=[Optional()], coerce=str)
+    employee_id = LazyChoiceField("Employee", validators=(_OPTIONAL,), coerce=str)
     active = BooleanField("Active", default=True)
     submit = SubmitField("Create user")
 
@@ -93,15 +141,14 @@ class UserEditForm(FlaskForm):
             ("MANAGER", "Manager"),
             ("EMPLOYEE", "Employee"),
         ],
-        validators=[DataRequired()],
+        validators=(_DATA_REQUIRED,),
     )
-    employee_id = SelectField("Employee", choices=[], validators=[Optional()], coerce=str)
+    employee_id = LazyChoiceField("Employee", validators=(_OPTIONAL,), coerce=str)
     active = BooleanField("Active", default=True)
     submit = SubmitField("Guardar cambios")
 
     def validate_role(self, field: SelectField) -> None:
-        allowed_roles = {"OWNER", "ADMIN", "MANAGER", "EMPLOYEE"}
-        if field.data not in allowed_roles:
+        if field.data not in _ALLOWED_ROLES:
             raise ValidationError("Rol invalido.")
 
     def validate_employee_id(self, field: SelectField) -> None:
@@ -110,10 +157,8 @@ class UserEditForm(FlaskForm):
         if role == "EMPLOYEE":
             if not employee_id:
                 raise ValidationError("Debe seleccionar un empleado para el rol EMPLOYEE.")
-            try:
-                UUID(employee_id)
-            except ValueError as exc:
-                raise ValidationError("Empleado invalido para el tenant actual.") from exc
+            if not _is_valid_uuid(employee_id):
+                raise ValidationError("Empleado invalido para el tenant actual.")
             return
 
         if employee_id:
@@ -121,12 +166,12 @@ class UserEditForm(FlaskForm):
 
 
 class LeaveRequestForm(FlaskForm):
-    type_id = SelectField("Vacacion / permiso", choices=[], validators=[DataRequired()], coerce=str)
-    date_from = DateField("Desde", validators=[DataRequired()])
-    date_to = DateField("Hasta", validators=[DataRequired()])
-    reason = TextAreaField("Motivo", validators=[DataRequired(), Length(min=10, max=500)])
+    type_id = SelectField("Vacacion / permiso", choices=[], validators=(_DATA_REQUIRED,), coerce=str)
+    date_from = DateField("Desde", validators=(_DATA_REQUIRED,))
+    date_to = DateField("Hasta", validators=(_DATA_REQUIRED,))
+    reason = TextAreaField("Motivo", validators=(_DATA_REQUIRED, Length(min=10, max=500)))
     attachment = FileField("Adjunto (opcional)")
-    minutes = IntegerField("Minutos (opcional)", validators=[Optional()])
+    minutes = IntegerField("Minutos (opcional)", validators=(_OPTIONAL,))
     submit = SubmitField("Enviar solicitud")
 
     def validate_date_to(self, field: DateField) -> None:
@@ -135,29 +180,27 @@ class LeaveRequestForm(FlaskForm):
 
 
 class PunchCorrectionRequestForm(FlaskForm):
-    source_event_id = StringField("Fichaje a rectificar", validators=[DataRequired(), Length(max=64)])
-    requested_date = DateField("Nueva fecha", validators=[DataRequired()])
-    requested_hour = IntegerField("Nueva hora", validators=[InputRequired(), NumberRange(min=0, max=23)])
-    requested_minute = IntegerField("Nuevos minutos", validators=[InputRequired(), NumberRange(min=0, max=59)])
+    source_event_id = StringField("Fichaje a rectificar", validators=(_DATA_REQUIRED, _MAX_LENGTH_64))
+    requested_date = DateField("Nueva fecha", validators=(_DATA_REQUIRED,))
+    requested_hour = IntegerField("Nueva hora", validators=(_INPUT_REQUIRED, NumberRange(min=0, max=23)))
+    requested_minute = IntegerField("Nuevos minutos", validators=(_INPUT_REQUIRED, NumberRange(min=0, max=59)))
     requested_kind = SelectField(
         "Nuevo tipo",
         choices=[("IN", "Entrada"), ("OUT", "Salida")],
-        validators=[DataRequired()],
+        validators=(_DATA_REQUIRED,),
     )
-    reason = TextAreaField("Motivo", validators=[DataRequired(), Length(min=10, max=300)])
+    reason = TextAreaField("Motivo", validators=(_DATA_REQUIRED, Length(min=10, max=300)))
     attachment = FileField("Adjunto (opcional)")
     submit = SubmitField("Enviar solicitud")
 
     def validate_source_event_id(self, field: StringField) -> None:
-        try:
-            UUID((field.data or "").strip())
-        except ValueError as exc:
-            raise ValidationError("Fichaje a rectificar invalido.") from exc
+        if not _is_valid_uuid((field.data or "").strip()):
+            raise ValidationError("Fichaje a rectificar invalido.")
 
 
 class DateRangeExportForm(FlaskForm):
-    date_from = DateField("From", validators=[DataRequired()], default=date.today)
-    date_to = DateField("To", validators=[DataRequired()], default=date.today)
+    date_from = DateField("From", validators=(_DATA_REQUIRED,), default=date.today)
+    date_to = DateField("To", validators=(_DATA_REQUIRED,), default=date.today)
     submit = SubmitField("Export CSV")
 
     def validate_date_to(self, field: DateField) -> None:
@@ -172,7 +215,7 @@ class AttendanceReportForm(FlaskForm):
             ("control", "Control horario"),
             ("executive", "Resumen ejecutivo"),
         ],
-        validators=[DataRequired()],
+        validators=(_DATA_REQUIRED,),
         default="control",
     )
     output_format = SelectField(
@@ -183,12 +226,12 @@ class AttendanceReportForm(FlaskForm):
             ("xlsx", "XLSX"),
             ("pdf", "PDF"),
         ],
-        validators=[DataRequired()],
+        validators=(_DATA_REQUIRED,),
         default="csv",
     )
-    employee_id = SelectField("Empleado (opcional)", choices=[], validators=[Optional()], coerce=str)
-    date_from = DateField("Desde", validators=[DataRequired()], default=date.today)
-    date_to = DateField("Hasta", validators=[DataRequired()], default=date.today)
+    employee_id = LazyChoiceField("Empleado (opcional)", validators=(_OPTIONAL,), coerce=str)
+    date_from = DateField("Desde", validators=(_DATA_REQUIRED,), default=date.today)
+    date_to = DateField("Hasta", validators=(_DATA_REQUIRED,), default=date.today)
     submit = SubmitField("Generar reporte")
 
     def validate_date_to(self, field: DateField) -> None:
@@ -199,17 +242,15 @@ class AttendanceReportForm(FlaskForm):
         employee_id = (field.data or "").strip()
         if not employee_id:
             return
-        try:
-            UUID(employee_id)
-        except ValueError as exc:
-            raise ValidationError("Empleado invalido.") from exc
+        if not _is_valid_uuid(employee_id):
+            raise ValidationError("Empleado invalido.")
 
 
 class ShiftCreateForm(FlaskForm):
-    name = StringField("Nombre", validators=[DataRequired(), Length(max=128)])
+    name = StringField("Nombre", validators=(_DATA_REQUIRED, Length(max=128)))
     break_counts_as_worked_bool = BooleanField("El descanso cuenta como jornada laboral", default=True)
-    break_minutes = IntegerField("Minutos de descanso", validators=[DataRequired(), NumberRange(min=0, max=1440)], default=30)
-    expected_hours = DecimalField("Horas trabajadas", validators=[DataRequired(), NumberRange(min=0, max=9999)], places=2)
+    break_minutes = IntegerField("Minutos de descanso", validators=(_DATA_REQUIRED, NumberRange(min=0, max=1440)), default=30)
+    expected_hours = DecimalField("Horas trabajadas", validators=(_DATA_REQUIRED, NumberRange(min=0, max=9999)), places=2)
     expected_hours_frequency = SelectField(
         "Frecuencia",
         choices=[
@@ -218,23 +259,21 @@ class ShiftCreateForm(FlaskForm):
             ("WEEKLY", "Semanales"),
             ("DAILY", "Diarias"),
         ],
-        validators=[DataRequired()],
+        validators=(_DATA_REQUIRED,),
         default="DAILY",
     )
     submit = SubmitField("Crear turno")
 
 
 class BulkEmployeeImportForm(FlaskForm):
-    csv_file = FileField("CSV de empleados", validators=[DataRequired()])
+    csv_file = FileField("CSV de empleados", validators=(_DATA_REQUIRED,))
     submit = SubmitField("Validar CSV")
 
 
 class BulkImportCommitForm(FlaskForm):
-    import_job_id = StringField("Import job id", validators=[DataRequired(), Length(max=64)])
+    import_job_id = StringField("Import job id", validators=(_DATA_REQUIRED, _MAX_LENGTH_64))
     submit = SubmitField("Confirmar importacion")
 
     def validate_import_job_id(self, field: StringField) -> None:
-        try:
-            UUID((field.data or "").strip())
-        except ValueError as exc:
-            raise ValidationError("Import job invalido.") from exc
+        if not _is_valid_uuid((field.data or "").strip()):
+            raise ValidationError("Import job invalido.")
@@ -0,0 +1,17 @@
+"""Time-ordered identifier helpers."""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+
+def uuidv7() -> uuid.UUID:
+    # RFC 9562 layout: 48-bit Unix ms timestamp, version 7, 74 random bits with the RFC variant.
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value &= ~(0xF << 76) & ~(0x3 << 62)
+    value |= (0x7 << 76) | (0x2 << 62)
+    return uuid.UUID(int=value)
@@ -26,16 +26,25 @@ from sqlalchemy import (
     Uuid,
     UniqueConstraint,
     event,
+    func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.extensions import db
+from app.ids import uuidv7
 
 
 def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def enum_values(enum_cls: type[enum.Enum]) -> list[str]:
+    return [member.value for member in enum_cls]
+
+
 class MembershipRole(str, enum.Enum):
     OWNER = "OWNER"
     ADMIN = "ADMIN"
@@ -97,7 +106,7 @@ class ImportJobStatus(str, enum.Enum):
 class Tenant(db.Model):
     __tablename__ = "tenants"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     slug: Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)
     payroll_cutoff_day: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
@@ -108,12 +117,12 @@ class Tenant(db.Model):
 class User(UserMixin, db.Model):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     must_change_password: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
 
     memberships: Mapped[list["Membership"]] = relationship(back_populates="user")
 
@@ -123,15 +132,15 @@ class User(UserMixin, db.Model):
 
 class Membership(db.Model):
     __tablename__ = "memberships"
-    __table_args__ = (
-        UniqueConstraint("tenant_id", "user_id", name="uq_memberships_tenant_user"),
-        Index("ix_memberships_tenant_user", "tenant_id", "user_id"),
-    )
+    __table_args__ = (UniqueConstraint("tenant_id", "user_id", name="uq_memberships_tenant_user"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    role: Mapped[MembershipRole] = mapped_column(Enum(MembershipRole, name="membership_role"), nullable=False)
+    role: Mapped[MembershipRole] = mapped_column(
+        Enum(MembershipRole, name="membership_role", values_callable=enum_values),
+        nullable=False,
+    )
     site_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, ForeignKey("sites.id", ondelete="SET NULL"), nullable=True)
     employee_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("employees.id", ondelete="SET NULL"), nullable=True
@@ -145,7 +154,7 @@ class Site(db.Model):
     __tablename__ = "sites"
     __table_args__ = (Index("ix_sites_tenant_name", "tenant_id", "name"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
 
@@ -157,7 +166,7 @@ class Employee(db.Model):
         UniqueConstraint("tenant_id", "email", name="uq_employees_tenant_email"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -166,28 +175,25 @@ class Employee(db.Model):
     punch_approver_user_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
-    active_status_changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    active_status_changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
 
 
 class Shift(db.Model):
     __tablename__ = "shifts"
-    __table_args__ = (
-        Index("ix_shifts_tenant_name", "tenant_id", "name"),
-        UniqueConstraint("tenant_id", "name", name="uq_shifts_tenant_name"),
-    )
+    __table_args__ = (UniqueConstraint("tenant_id", "name", name="uq_shifts_tenant_name"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String(128), nullable=False)
     break_counts_as_worked_bool: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     break_minutes: Mapped[int] = mapped_column(Integer, nullable=False, default=30)
     expected_hours: Mapped[Decimal] = mapped_column(Numeric(8, 2), nullable=False, default=Decimal("8.00"))
     expected_hours_frequency: Mapped[ExpectedHoursFrequency] = mapped_column(
-        Enum(ExpectedHoursFrequency, name="expected_hours_frequency"),
+        Enum(ExpectedHoursFrequency, name="expected_hours_frequency", values_callable=enum_values),
         nullable=False,
         default=ExpectedHoursFrequency.DAILY,
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
 
 
 class EmployeeShiftAssignment(db.Model):
@@ -198,40 +204,55 @@ class EmployeeShiftAssignment(db.Model):
         CheckConstraint("effective_to IS NULL OR effective_to >= effective_from", name="ck_employee_shift_assignment_dates"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     employee_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
     shift_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("shifts.id", ondelete="RESTRICT"), nullable=False)
     effective_from: Mapped[date] = mapped_column(Date, nullable=False)
     effective_to: Mapped[date | None] = mapped_column(Date, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
 
 
 class TimeEvent(db.Model):
     __tablename__ = "time_events"
-    __table_args__ = (Index("ix_time_events_tenant_employee_ts", "tenant_id", "employee_id", "ts"),)
+    __table_args__ = (
+        Index(
+            "ix_time_events_tenant_employee_ts",
+            "tenant_id",
+            "employee_id",
+            "ts",
+            postgresql_include=("type", "source"),
+        ),
+        Index("ix_time_events_tenant_ts", "tenant_id", "ts"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuidv7, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     employee_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
-    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
-    type: Mapped[TimeEventType] = mapped_column(Enum(TimeEventType, name="time_event_type"), nullable=False)
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
+    type: Mapped[TimeEventType] = mapped_column(
+        Enum(TimeEventType, name="time_event_type", values_callable=enum_values),
+        nullable=False,
+    )
     source: Mapped[TimeEventSource] = mapped_column(
-        Enum(TimeEventSource, name="time_event_source"),
+        Enum(TimeEventSource, name="time_event_source", values_callable=enum_values),
         nullable=False,
         default=TimeEventSource.WEB,
     )
-    meta_json: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    meta_json: Mapped[dict[str, Any] | None] = mapped_column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
 
 
+# On PostgreSQL the time_events_append_only trigger (migration 0011) enforces this.
 @event.listens_for(TimeEvent, "before_update")
-def prevent_time_event_update(_mapper: object, _connection: object, _target: object) -> None:
-    raise ValueError("time_events are append-only")
+def prevent_time_event_update(_mapper: object, connection: Connection, _target: object) -> None:
+    if connection.dialect.name != "postgresql":
+        raise ValueError("time_events are append-only")
 
 
 @event.listens_for(TimeEvent, "before_delete")
-def prevent_time_event_delete(_mapper: object, _connection: object, _target: object) -> None:
-    raise ValueError("time_events are append-only")
+def prevent_time_event_delete(_mapper: object, connection: Connection, _target: object) -> None:
+    if connection.dialect.name != "postgresql":
+        raise ValueError("time_events are append-only")
 
 
 class PunchCorrectionRequest(db.Model):
@@ -239,27 +260,37 @@ class PunchCorrectionRequest(db.Model):
     __table_args__ = (
         Index("ix_punch_correction_requests_tenant_status", "tenant_id", "status"),
         Index("ix_punch_correction_requests_employee_created", "employee_id", "created_at"),
+        Index(
+            "ix_punch_correction_requests_pending",
+            "tenant_id",
+            "created_at",
+            postgresql_where=text("status = 'REQUESTED'"),
+            sqlite_where=text("status = 'REQUESTED'"),
+        ),
         CheckConstraint(
             "requested_type IN ('IN', 'OUT')",
             name="ck_punch_correction_requests_requested_type",
         ),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuidv7, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     employee_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
     source_event_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("time_events.id", ondelete="RESTRICT"), nullable=False
     )
     requested_ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    requested_type: Mapped[TimeEventType] = mapped_column(Enum(TimeEventType, name="time_event_type"), nullable=False)
+    requested_type: Mapped[TimeEventType] = mapped_column(
+        Enum(TimeEventType, name="time_event_type", values_callable=enum_values),
+        nullable=False,
+    )
     reason: Mapped[str] = mapped_column(Text, nullable=False)
     approver_comment: Mapped[str | None] = mapped_column(Text, nullable=True)
     attachment_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     attachment_mime: Mapped[str | None] = mapped_column(String(128), nullable=True)
     attachment_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
     status: Mapped[PunchCorrectionStatus] = mapped_column(
-        Enum(PunchCorrectionStatus, name="punch_correction_status"),
+        Enum(PunchCorrectionStatus, name="punch_correction_status", values_callable=enum_values),
         nullable=False,
         default=PunchCorrectionStatus.REQUESTED,
     )
@@ -272,7 +303,7 @@ class PunchCorrectionRequest(db.Model):
     applied_event_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("time_events.id", ondelete="SET NULL"), nullable=True
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
     decided_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
@@ -285,7 +316,7 @@ class TimeEventSupersession(db.Model):
         Index("ix_time_event_supersessions_tenant_original", "tenant_id", "original_event_id"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     original_event_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("time_events.id", ondelete="RESTRICT"), nullable=False
@@ -296,14 +327,14 @@ class TimeEventSupersession(db.Model):
     correction_request_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("punch_correction_requests.id", ondelete="CASCADE"), nullable=False
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
 
 
 class TimeAdjustment(db.Model):
     __tablename__ = "time_adjustments"
     __table_args__ = (Index("ix_time_adjustments_tenant_employee", "tenant_id", "employee_id"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuidv7, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     employee_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
     event_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -311,17 +342,14 @@ class TimeAdjustment(db.Model):
     )
     reason: Mapped[str] = mapped_column(Text, nullable=False)
     minutes_delta: Mapped[int] = mapped_column(Integer, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
 
 
 class LeaveType(db.Model):
     __tablename__ = "leave_types"
-    __table_args__ = (
-        UniqueConstraint("tenant_id", "code", name="uq_leave_types_tenant_code"),
-        Index("ix_leave_types_tenant_code", "tenant_id", "code"),
-    )
+    __table_args__ = (UniqueConstraint("tenant_id", "code", name="uq_leave_types_tenant_code"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     code: Mapped[str] = mapped_column(String(32), nullable=False)
     name: Mapped[str] = mapped_column(String(128), nullable=False)
@@ -338,7 +366,7 @@ class ShiftLeavePolicy(db.Model):
         CheckConstraint("valid_to >= valid_from", name="ck_shift_leave_policies_dates"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     shift_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("shifts.id", ondelete="CASCADE"), nullable=False)
     leave_type_id: Mapped[uuid.UUID] = mapped_column(
@@ -346,17 +374,29 @@ class ShiftLeavePolicy(db.Model):
     )
     name: Mapped[str] = mapped_column(String(128), nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(8, 2), nullable=False)
-    unit: Mapped[LeavePolicyUnit] = mapped_column(Enum(LeavePolicyUnit, name="leave_policy_unit"), nullable=False)
+    unit: Mapped[LeavePolicyUnit] = mapped_column(
+        Enum(LeavePolicyUnit, name="leave_policy_unit", values_callable=enum_values),
+        nullable=False,
+    )
     valid_from: Mapped[date] = mapped_column(Date, nullable=False)
     valid_to: Mapped[date] = mapped_column(Date, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
 
 
 class LeaveRequest(db.Model):
     __tablename__ = "leave_requests"
-    __table_args__ = (Index("ix_leave_requests_tenant_status", "tenant_id", "status"),)
+    __table_args__ = (
+        Index("ix_leave_requests_tenant_status", "tenant_id", "status"),
+        Index(
+            "ix_leave_requests_pending",
+            "tenant_id",
+            "created_at",
+            postgresql_where=text("status = 'REQUESTED'"),
+            sqlite_where=text("status = 'REQUESTED'"),
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuidv7, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     employee_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
     type_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("leave_types.id", ondelete="CASCADE"), nullable=False)
@@ -372,22 +412,28 @@ class LeaveRequest(db.Model):
     attachment_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
     minutes: Mapped[int | None] = mapped_column(Integer, nullable=True)
     status: Mapped[LeaveRequestStatus] = mapped_column(
-        Enum(LeaveRequestStatus, name="leave_request_status"),
+        Enum(LeaveRequestStatus, name="leave_request_status", values_callable=enum_values),
         nullable=False,
         default=LeaveRequestStatus.REQUESTED,
     )
     approver_user_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
     decided_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 class AuditLog(db.Model):
     __tablename__ = "audit_log"
-    __table_args__ = (Index("ix_audit_log_tenant_ts", "tenant_id", "ts"),)
+    __table_args__ = (
+        # audit_log is append-only and ts follows physical order, so a BRIN summary replaces a full B-tree.
+        Index("ix_audit_log_ts_brin", "ts", postgresql_using="brin", postgresql_with={"pages_per_range": 32}).ddl_if(
+            dialect="postgresql"
+        ),
+        Index("ix_audit_log_payload_gin", "payload_json", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuidv7, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     actor_user_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
@@ -395,8 +441,10 @@ class AuditLog(db.Model):
     action: Mapped[str] = mapped_column(String(128), nullable=False)
     entity_type: Mapped[str] = mapped_column(String(64), nullable=False)
     entity_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, nullable=True)
-    payload_json: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
-    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    payload_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=True, deferred=True
+    )
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
 
 
 class ImportJob(db.Model):
@@ -406,13 +454,13 @@ class ImportJob(db.Model):
         Index("ix_import_jobs_tenant_expires", "tenant_id", "expires_at"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     tenant_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     created_by_user_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     status: Mapped[ImportJobStatus] = mapped_column(
-        Enum(ImportJobStatus, name="import_job_status"),
+        Enum(ImportJobStatus, name="import_job_status", values_callable=enum_values),
         nullable=False,
         default=ImportJobStatus.PREVIEWED,
     )
@@ -422,4 +470,4 @@ class ImportJob(db.Model):
     summary_json: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     committed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=now_utc, server_default=func.now())
@@ -2,47 +2,147 @@
 
 from __future__ import annotations
 
+import csv
 import io
 import json
+import re
 import textwrap
 import zipfile
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from html import escape as xml_escape
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+from flask import current_app
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
 
-def to_csv_bytes(headers: list[str], rows: list[list[Any]]) -> bytes:
-    out = io.StringIO()
-    import csv
+_XML_SPECIAL_CHARS_RE = re.compile(r"[&<>\"']")
+_PDF_SPECIAL_CHARS_RE = re.compile(r"[\\()]")
 
-    writer = csv.writer(out)
+# Static OOXML parts shared by every workbook; only workbook.xml, core.xml timestamps and the sheet vary.
+_WORKBOOK_RELS_XML = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    b'Target="worksheets/sheet1.xml"/>'
+    b"</Relationships>"
+)
+_ROOT_RELS_XML = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    b'Target="xl/workbook.xml"/>'
+    b'<Relationship Id="rId2" '
+    b'Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" '
+    b'Target="docProps/core.xml"/>'
+    b'<Relationship Id="rId3" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties" '
+    b'Target="docProps/app.xml"/>'
+    b"</Relationships>"
+)
+_CONTENT_TYPES_XML = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    b'<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    b'<Default Extension="xml" ContentType="application/xml"/>'
+    b'<Override PartName="/xl/workbook.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    b'<Override PartName="/xl/worksheets/sheet1.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    b'<Override PartName="/docProps/core.xml" '
+    b'ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+    b'<Override PartName="/docProps/app.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>'
+    b"</Types>"
+)
+_CORE_XML_TEMPLATE = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+    b'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    b'xmlns:dcterms="http://purl.org/dc/terms/" '
+    b'xmlns:dcmitype="http://purl.org/dc/dcmitype/" '
+    b'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+    b"<dc:title>Control Horario Report</dc:title>"
+    b'<dcterms:created xsi:type="dcterms:W3CDTF">%s</dcterms:created>'
+    b'<dcterms:modified xsi:type="dcterms:W3CDTF">%s</dcterms:modified>'
+    b"</cp:coreProperties>"
+)
+_APP_XML = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties" '
+    b'xmlns:vt="http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes">'
+    b"<Application>Control Horario</Application>"
+    b"</Properties>"
+)
+
+_PDF_HEADER = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+_PDF_FONT_OBJECT = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+
+
+def to_csv_bytes(headers: list[str], rows: Iterable[list[Any]]) -> bytes:
+    out = io.BytesIO()
+    text_out = io.TextIOWrapper(out, encoding="utf-8", newline="")
+    writer = csv.writer(text_out)
     writer.writerow(headers)
     for row in rows:
         writer.writerow([_stringify(value) for value in row])
-    return out.getvalue().encode("utf-8")
+    text_out.flush()
+    text_out.detach()
+    return out.getvalue()
+
+
+def stream_csv_copy(connection: Connection, stmt: Select, headers: list[str]) -> Iterator[bytes]:
+    """Stream ``stmt`` as CSV rendered by PostgreSQL ``COPY ... TO STDOUT``.
+
+    The output is byte-for-byte what ``to_csv_bytes`` writes for the same values,
+    provided the statement renders each column as the text the Python path would.
+    The COPY is started and its first row read before this returns, so a failing
+    query raises here, while the caller can still answer with an error page.
+    """
+    compiled = stmt.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+    with ExitStack() as stack:
+        cursor = stack.enter_context(connection.connection.cursor())
+        copy = stack.enter_context(cursor.copy(f"COPY ({compiled}) TO STDOUT WITH (FORMAT csv)", compiled.params))
+        copy_rows = iter(copy)
+        first_row = next(copy_rows, None)
+        cleanup = stack.pop_all()
+    return _iter_csv_copy(cleanup, to_csv_bytes(headers, []), first_row, copy_rows)
+
+
+def _iter_csv_copy(
+    cleanup: ExitStack,
+    header: bytes,
+    first_row: Any,
+    copy_rows: Iterator[Any],
+) -> Iterator[bytes]:
+    with cleanup:
+        yield header
+        if first_row is None:
+            return
+        yield _copy_row_to_csv(first_row)
+        try:
+            for row in copy_rows:
+                yield _copy_row_to_csv(row)
+        except Exception:
+            # Status and headers are already sent; log it so a truncated download is not silent.
+            current_app.logger.exception("CSV COPY export failed after the response started.")
+            raise
+
+
+def _copy_row_to_csv(row: Any) -> bytes:
+    # libpq hands COPY data over one row at a time and COPY TO STDOUT always ends rows with
+    # "\n"; swap that for the "\r\n" csv.writer uses. Newlines inside quoted values stay as-is.
+    return bytes(row[:-1]) + b"\r\n"
 
 
 def to_json_bytes(payload: dict[str, Any]) -> bytes:
     return json.dumps(payload, ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
 
 
-def to_xlsx_bytes(headers: list[str], rows: list[list[Any]], sheet_name: str = "Report") -> bytes:
-    sheet_xml_rows: list[str] = []
-    all_rows = [headers] + [[_stringify(value) for value in row] for row in rows]
-    for row_index, row_values in enumerate(all_rows, start=1):
-        cells: list[str] = []
-        for col_index, value in enumerate(row_values, start=1):
-            cell_ref = f"{_xlsx_col(col_index)}{row_index}"
-            safe_text = xml_escape(_truncate(value, 32767))
-            cells.append(f'<c r="{cell_ref}" t="inlineStr"><is><t>{safe_text}</t></is></c>')
-        sheet_xml_rows.append(f'<row r="{row_index}">{"".join(cells)}</row>')
-
-    sheet_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
-        f"<sheetData>{''.join(sheet_xml_rows)}</sheetData>"
-        "</worksheet>"
-    )
+def to_xlsx_bytes(headers: list[str], rows: Iterable[list[Any]], sheet_name: str = "Report") -> bytes:
     workbook_xml = (
         '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
         '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
@@ -50,76 +150,45 @@ def to_xlsx_bytes(headers: list[str], rows: list[list[Any]], sheet_name: str = "
         f'<sheets><sheet name="{xml_escape(_truncate(sheet_name, 31))}" sheetId="1" r:id="rId1"/></sheets>'
         "</workbook>"
     )
-    workbook_rels_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" '
-        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
-        'Target="worksheets/sheet1.xml"/>'
-        "</Relationships>"
-    )
-    root_rels_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" '
-        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
-        'Target="xl/workbook.xml"/>'
-        '<Relationship Id="rId2" '
-        'Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" '
-        'Target="docProps/core.xml"/>'
-        '<Relationship Id="rId3" '
-        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties" '
-        'Target="docProps/app.xml"/>'
-        "</Relationships>"
-    )
-    content_types_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
-        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
-        '<Default Extension="xml" ContentType="application/xml"/>'
-        '<Override PartName="/xl/workbook.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
-        '<Override PartName="/xl/worksheets/sheet1.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
-        '<Override PartName="/docProps/core.xml" '
-        'ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
-        '<Override PartName="/docProps/app.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>'
-        "</Types>"
-    )
-    now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    core_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
-        'xmlns:dc="http://purl.org/dc/elements/1.1/" '
-        'xmlns:dcterms="http://purl.org/dc/terms/" '
-        'xmlns:dcmitype="http://purl.org/dc/dcmitype/" '
-        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
-        "<dc:title>Control Horario Report</dc:title>"
-        f"<dcterms:created xsi:type=\"dcterms:W3CDTF\">{now_iso}</dcterms:created>"
-        f"<dcterms:modified xsi:type=\"dcterms:W3CDTF\">{now_iso}</dcterms:modified>"
-        "</cp:coreProperties>"
-    )
-    app_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties" '
-        'xmlns:vt="http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes">'
-        "<Application>Control Horario</Application>"
-        "</Properties>"
-    )
+    now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ").encode("ascii")
 
     out = io.BytesIO()
     with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("[Content_Types].xml", content_types_xml)
-        zf.writestr("_rels/.rels", root_rels_xml)
-        zf.writestr("docProps/core.xml", core_xml)
-        zf.writestr("docProps/app.xml", app_xml)
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", _ROOT_RELS_XML)
+        zf.writestr("docProps/core.xml", _CORE_XML_TEMPLATE % (now_iso, now_iso))
+        zf.writestr("docProps/app.xml", _APP_XML)
         zf.writestr("xl/workbook.xml", workbook_xml)
-        zf.writestr("xl/_rels/workbook.xml.rels", workbook_rels_xml)
-        zf.writestr("xl/worksheets/sheet1.xml", sheet_xml)
+        zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            _write_sheet_xml(sheet, headers, rows)
     return out.getvalue()
 
 
+def _write_sheet_xml(sheet: io.BufferedIOBase, headers: list[str], rows: Iterable[list[Any]]) -> None:
+    sheet.write(
+        b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        b"<sheetData>"
+    )
+    col_refs: list[str] = []
+    for row_index, row_values in enumerate(_sheet_rows(headers, rows), start=1):
+        while len(col_refs) < len(row_values):
+            col_refs.append(_xlsx_col(len(col_refs) + 1))
+        cells = "".join(
+            f'<c r="{col_ref}{row_index}" t="inlineStr"><is><t>{_xlsx_text(value)}</t></is></c>'
+            for col_ref, value in zip(col_refs, row_values)
+        )
+        sheet.write(f'<row r="{row_index}">{cells}</row>'.encode("utf-8"))
+    sheet.write(b"</sheetData></worksheet>")
+
+
+def _sheet_rows(headers: list[str], rows: Iterable[list[Any]]) -> Iterable[list[str]]:
+    yield headers
+    for row in rows:
+        yield [_stringify(value) for value in row]
+
+
 def to_pdf_bytes(title: str, headers: list[str], rows: list[list[Any]]) -> bytes:
     text_lines = [title, ""]
     text_lines.append(" | ".join(headers))
@@ -146,13 +215,13 @@ def to_pdf_bytes(title: str, headers: list[str], rows: list[list[Any]]) -> bytes
 
     catalog_id = add_object(b"")
     pages_id = add_object(b"")
-    font_id = add_object(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    font_id = add_object(_PDF_FONT_OBJECT)
     page_ids: list[int] = []
     for page_lines in pages:
         stream_cmds = [b"BT", b"/F1 10 Tf", b"50 800 Td", b"14 TL"]
         for line in page_lines:
             escaped = _pdf_escape(_truncate(line, 120))
-            stream_cmds.append(f"({escaped}) Tj".encode("latin-1", "replace"))
+            stream_cmds.append(b"(%b) Tj" % escaped.encode("latin-1", "replace"))
             stream_cmds.append(b"T*")
         stream_cmds.append(b"ET")
         stream = b"\n".join(stream_cmds)
@@ -171,23 +240,24 @@ def to_pdf_bytes(title: str, headers: list[str], rows: list[list[Any]]) -> bytes
     objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids_refs}] /Count {len(page_ids)} >>".encode("latin-1")
     objects[catalog_id - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode("latin-1")
 
-    pdf = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    # bytearray.extend keeps assembly linear; bytes += would copy the whole document per object.
+    pdf = bytearray(_PDF_HEADER)
     offsets = [0]
     for index, obj in enumerate(objects, start=1):
         offsets.append(len(pdf))
-        pdf += f"{index} 0 obj\n".encode("latin-1") + obj + b"\nendobj\n"
+        pdf.extend(b"%d 0 obj\n" % index)
+        pdf.extend(obj)
+        pdf.extend(b"\nendobj\n")
 
     xref_offset = len(pdf)
-    pdf += f"xref\n0 {len(objects) + 1}\n".encode("latin-1")
-    pdf += b"0000000000 65535 f \n"
+    pdf.extend(b"xref\n0 %d\n" % (len(objects) + 1))
+    pdf.extend(b"0000000000 65535 f \n")
     for offset in offsets[1:]:
-        pdf += f"{offset:010d} 00000 n \n".encode("latin-1")
-    pdf += (
-        f"trailer\n<< /Size {len(objects) + 1} /Root {catalog_id} 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode(
-            "latin-1"
-        )
+        pdf.extend(b"%010d 00000 n \n" % offset)
+    pdf.extend(
+        b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog_id, xref_offset)
     )
-    return pdf
+    return bytes(pdf)
 
 
 def _json_default(value: Any) -> str:
@@ -210,6 +280,13 @@ def _truncate(value: str, max_len: int) -> str:
     return value[: max_len - 3] + "..."
 
 
+def _xlsx_text(value: str) -> str:
+    text = _truncate(value, 32767)
+    if _XML_SPECIAL_CHARS_RE.search(text) is None:
+        return text
+    return xml_escape(text)
+
+
 def _xlsx_col(index: int) -> str:
     chars: list[str] = []
     value = index
@@ -220,4 +297,6 @@ def _xlsx_col(index: int) -> str:
 
 
 def _pdf_escape(text: str) -> str:
+    if _PDF_SPECIAL_CHARS_RE.search(text) is None:
+        return text
     return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
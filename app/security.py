@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
-from werkzeug.security import check_password_hash, generate_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from werkzeug.security import check_password_hash
+
+
+_ARGON2_PREFIX = "$argon2"
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 
 
 def hash_secret(raw_value: str) -> str:
-    return generate_password_hash(raw_value, method="pbkdf2:sha256", salt_length=16)
+    return _password_hasher.hash(raw_value)
+
+
+def hash_pin(raw_pin: str) -> str:
+    return hash_secret(raw_pin)
 
 
 def verify_secret(secret_hash: str, raw_value: str) -> bool:
-    return check_password_hash(secret_hash, raw_value)
+    if not secret_hash.startswith(_ARGON2_PREFIX):
+        # Hashes written before the Argon2id switch use werkzeug's pbkdf2:sha256 format.
+        return check_password_hash(secret_hash, raw_value)
+    try:
+        return _password_hasher.verify(secret_hash, raw_value)
+    except (VerificationError, InvalidHashError):
+        return False
+
 
+def secret_needs_rehash(secret_hash: str) -> bool:
+    if not secret_hash.startswith(_ARGON2_PREFIX):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(secret_hash)
+    except InvalidHashError:
+        return True
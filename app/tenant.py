@@ -6,9 +6,10 @@ import functools
 import uuid
 from typing import Callable
 
-from flask import abort, g, session
+from flask import abort, current_app, g, session
 from flask_login import current_user
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 
 from app.extensions import db
 from app.models import Membership, MembershipRole
@@ -47,11 +48,25 @@ def current_membership() -> Membership | None:
     except ValueError:
         return None
 
+    cache: dict[tuple[uuid.UUID, uuid.UUID], Membership | None] = g.setdefault("_membership_cache", {})
+    cache_key = (user_id, tenant_id)
+    if cache_key in cache:
+        return cache[cache_key]
+
     stmt = select(Membership).where(
         Membership.user_id == user_id,
         Membership.tenant_id == tenant_id,
     )
-    return db.session.execute(stmt).scalar_one_or_none()
+    if current_app.testing:
+        # Role checks only read membership columns; fail loudly if a caller starts lazy-loading relations.
+        stmt = stmt.options(raiseload("*"))
+    membership = db.session.execute(stmt).scalar_one_or_none()
+    cache[cache_key] = membership
+    return membership
+
+
+def clear_membership_cache() -> None:
+    g.pop("_membership_cache", None)
 
 
 def landing_endpoint_for_membership(membership: Membership | None) -> str:
@@ -8,22 +8,38 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import select
-from sqlalchemy.sql import Select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql import ColumnElement, Select
 
+from app.extensions import db
 from app.models import Employee, TimeEvent, TimeEventSupersession
 
 
-def _not_superseded_condition():
-    superseded_subquery = select(TimeEventSupersession.id).where(
-        TimeEventSupersession.original_event_id == TimeEvent.id
-    )
-    return ~superseded_subquery.exists()
+REPORT_EVENT_COLUMNS: tuple[ColumnElement[Any], ...] = (
+    TimeEvent.id,
+    TimeEvent.employee_id,
+    TimeEvent.ts,
+    TimeEvent.type,
+    TimeEvent.source,
+    TimeEvent.meta_json,
+    Employee.name.label("employee_name"),
+)
+
+
+def _exclude_superseded(stmt: Select) -> Select:
+    # LEFT JOIN ... IS NULL anti-join: flattened by every backend, unlike a correlated NOT EXISTS on SQLite.
+    return stmt.outerjoin(
+        TimeEventSupersession,
+        TimeEventSupersession.original_event_id == TimeEvent.id,
+    ).where(TimeEventSupersession.id.is_(None))
 
 
 def visible_time_events_stmt() -> Select:
-    return select(TimeEvent).where(_not_superseded_condition())
+    return _exclude_superseded(select(TimeEvent))
 
 
 def visible_employee_events_between_stmt(
@@ -49,8 +65,36 @@ def visible_employee_recent_events_stmt(employee_id: uuid.UUID, limit: int) -> S
 
 def visible_events_with_employee_between_stmt(start: datetime, end: datetime) -> Select:
     return (
-        select(TimeEvent, Employee)
-        .join(Employee, Employee.id == TimeEvent.employee_id)
-        .where(TimeEvent.ts >= start, TimeEvent.ts <= end, _not_superseded_condition())
+        _exclude_superseded(select(TimeEvent, Employee).join(Employee, Employee.id == TimeEvent.employee_id))
+        .where(TimeEvent.ts >= start, TimeEvent.ts <= end)
         .order_by(TimeEvent.ts.asc())
     )
+
+
+def visible_events_for_report_stmt(
+    start: datetime,
+    end: datetime,
+    columns: tuple[ColumnElement[Any], ...] = REPORT_EVENT_COLUMNS,
+) -> Select:
+    # Plain column rows for reports: no ORM entities, no identity map.
+    return (
+        _exclude_superseded(
+            select(*columns).select_from(TimeEvent).join(Employee, Employee.id == TimeEvent.employee_id)
+        )
+        .where(TimeEvent.ts >= start, TimeEvent.ts <= end)
+        .order_by(TimeEvent.ts.asc())
+    )
+
+
+def bulk_insert_events(rows: list[dict[str, Any]]) -> None:
+    # One executemany INSERT. Rows must carry their id: the uuidv7 default would give a replayed
+    # batch fresh ids, so only caller-supplied ids let ON CONFLICT skip events already stored.
+    if not rows:
+        return
+    if any(row.get("id") is None for row in rows):
+        raise ValueError("bulk_insert_events rows need an explicit id.")
+    if db.session.get_bind().dialect.name == "postgresql":
+        stmt = pg_insert(TimeEvent)
+    else:
+        stmt = sqlite_insert(TimeEvent)
+    db.session.execute(stmt.on_conflict_do_nothing(index_elements=["id"]), rows)
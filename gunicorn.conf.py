@@ -2,11 +2,13 @@ import multiprocessing
 
 
 bind = "0.0.0.0:8000"
-workers = max(2, multiprocessing.cpu_count() * 2 + 1)
-worker_class = "sync"
+# Requests spend most of their time waiting on PostgreSQL; threads overlap that wait
+# without multiplying per-process memory. Keep threads <= pool_size + max_overflow.
+workers = max(2, multiprocessing.cpu_count())
+worker_class = "gthread"
+threads = 8
 timeout = 60
 graceful_timeout = 30
 keepalive = 5
 accesslog = "-"
 errorlog = "-"
-
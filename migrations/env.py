@@ -44,7 +44,14 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata, compare_type=True)
+        # One transaction per revision: each commits with its alembic_version bump, so follow-up
+        # revisions such as the VALIDATE CONSTRAINT ones run apart from the DDL they check.
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=True,
+            transaction_per_migration=True,
+        )
         with context.begin_transaction():
             context.run_migrations()
 
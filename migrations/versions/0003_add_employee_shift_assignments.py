@@ -7,9 +7,8 @@ Create Date: 2026-02-13
 
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
+from datetime import date
 from typing import Sequence
-import uuid
 
 from alembic import op
 import sqlalchemy as sa
@@ -22,6 +21,10 @@ depends_on: Sequence[str] | None = None
 
 
 def upgrade() -> None:
+    # Transaction-local: the backfill is idempotent to re-run, and the index builds at the end get more sort memory.
+    op.execute("SET LOCAL synchronous_commit = off")
+    op.execute("SET LOCAL maintenance_work_mem = '256MB'")
+
     op.create_table(
         "employee_shift_assignments",
         sa.Column("id", sa.Uuid(), nullable=False),
@@ -36,13 +39,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["shift_id"], ["shifts.id"], ondelete="RESTRICT"),
         sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("id"),
-        sa.UniqueConstraint("employee_id", "effective_from", name="uq_employee_shift_assignments_employee_from"),
-    )
-    op.create_index(
-        "ix_employee_shift_assignments_tenant_employee_from",
-        "employee_shift_assignments",
-        ["tenant_id", "employee_id", "effective_from"],
-        unique=False,
     )
 
     bind = op.get_bind()
@@ -75,31 +71,47 @@ def upgrade() -> None:
 
     default_effective_from = date(1970, 1, 1)
     tenant_rows = bind.execute(sa.select(tenants.c.id)).all()
+    # One pass per tenant: under FORCE ROW LEVEL SECURITY only rows for app.tenant_id are visible.
     for (tenant_id,) in tenant_rows:
-        bind.exec_driver_sql(f"SET LOCAL app.tenant_id = '{tenant_id}'")
-        shift_id = bind.execute(
+        bind.execute(sa.text("SELECT set_config('app.tenant_id', :tenant_id, true)"), {"tenant_id": str(tenant_id)})
+        first_shift_id = (
             sa.select(shifts.c.id)
             .where(shifts.c.tenant_id == tenant_id)
             .order_by(shifts.c.created_at.asc(), shifts.c.name.asc())
             .limit(1)
-        ).scalar_one_or_none()
-        if shift_id is None:
-            continue
-        employee_rows = bind.execute(
-            sa.select(employees.c.id).where(employees.c.tenant_id == tenant_id)
-        ).all()
-        for (employee_id,) in employee_rows:
-            bind.execute(
-                sa.insert(assignments).values(
-                    id=uuid.uuid4(),
-                    tenant_id=tenant_id,
-                    employee_id=employee_id,
-                    shift_id=shift_id,
-                    effective_from=default_effective_from,
-                    effective_to=None,
-                    created_at=datetime.now(timezone.utc),
-                )
+            .scalar_subquery()
+        )
+        bind.execute(
+            sa.insert(assignments).from_select(
+                ["id", "tenant_id", "employee_id", "shift_id", "effective_from", "effective_to", "created_at"],
+                sa.select(
+                    sa.func.gen_random_uuid(),
+                    employees.c.tenant_id,
+                    employees.c.id,
+                    first_shift_id,
+                    sa.literal(default_effective_from, sa.Date()),
+                    sa.null(),
+                    sa.func.now(),
+                ).where(
+                    employees.c.tenant_id == tenant_id,
+                    first_shift_id.is_not(None),
+                    ~sa.exists().where(assignments.c.employee_id == employees.c.id),
+                ),
             )
+        )
+
+    # Built after the backfill: one index build is cheaper than maintaining both B-trees per inserted row.
+    op.create_unique_constraint(
+        "uq_employee_shift_assignments_employee_from",
+        "employee_shift_assignments",
+        ["employee_id", "effective_from"],
+    )
+    op.create_index(
+        "ix_employee_shift_assignments_tenant_employee_from",
+        "employee_shift_assignments",
+        ["tenant_id", "employee_id", "effective_from"],
+        unique=False,
+    )
 
 
 def downgrade() -> None:
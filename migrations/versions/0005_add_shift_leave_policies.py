@@ -24,10 +24,12 @@ leave_policy_unit = sa.Enum("DAYS", "HOURS", name="leave_policy_unit")
 
 def upgrade() -> None:
     bind = op.get_bind()
-    tenant_id = bind.execute(sa.text("SELECT id::text FROM tenants ORDER BY id LIMIT 1")).scalar_one_or_none()
-    if tenant_id is None:
-        tenant_id = "00000000-0000-0000-0000-000000000000"
-    bind.exec_driver_sql(f"SET LOCAL app.tenant_id = '{tenant_id}'")
+    tenants = sa.table("tenants", sa.column("id", sa.Uuid()))
+    tenant_id = bind.execute(sa.select(tenants.c.id).order_by(tenants.c.id).limit(1)).scalar_one_or_none()
+    bind.execute(
+        sa.text("SELECT set_config('app.tenant_id', :tenant_id, true)"),
+        {"tenant_id": str(tenant_id or "00000000-0000-0000-0000-000000000000")},
+    )
 
     op.create_table(
         "shift_leave_policies",
@@ -63,7 +65,9 @@ def upgrade() -> None:
         ["leave_policy_id"],
         ["id"],
         ondelete="SET NULL",
+        postgresql_not_valid=True,
     )
+    # Validated by 0020_validate_leave_policy_fk, in its own transaction.
 
 
 def downgrade() -> None:
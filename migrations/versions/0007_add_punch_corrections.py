@@ -42,14 +42,13 @@ def upgrade() -> None:
     bind = op.get_bind()
     punch_correction_status.create(bind, checkfirst=True)
 
-    op.add_column("employees", sa.Column("punch_approver_user_id", sa.Uuid(), nullable=True))
-    op.create_foreign_key(
-        "fk_employees_punch_approver_user_id",
-        "employees",
-        "users",
-        ["punch_approver_user_id"],
-        ["id"],
-        ondelete="SET NULL",
+    # One ALTER TABLE so employees is locked once for both the column and its NOT VALID foreign key;
+    # 0021_validate_punch_approver_fk validates it in its own transaction.
+    op.execute(
+        "ALTER TABLE employees "
+        "ADD COLUMN punch_approver_user_id UUID, "
+        "ADD CONSTRAINT fk_employees_punch_approver_user_id FOREIGN KEY (punch_approver_user_id) "
+        "REFERENCES users (id) ON DELETE SET NULL NOT VALID"
     )
 
     op.create_table(
@@ -20,27 +20,34 @@ depends_on: Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    op.add_column("leave_requests", sa.Column("reason", sa.Text(), nullable=False, server_default=sa.text("''")))
-    op.add_column("leave_requests", sa.Column("approver_comment", sa.Text(), nullable=True))
-    op.add_column("leave_requests", sa.Column("attachment_name", sa.String(length=255), nullable=True))
-    op.add_column("leave_requests", sa.Column("attachment_mime", sa.String(length=128), nullable=True))
-    op.add_column("leave_requests", sa.Column("attachment_blob", sa.LargeBinary(), nullable=True))
-    op.alter_column("leave_requests", "reason", server_default=None)
-
-    op.add_column("punch_correction_requests", sa.Column("approver_comment", sa.Text(), nullable=True))
-    op.add_column("punch_correction_requests", sa.Column("attachment_name", sa.String(length=255), nullable=True))
-    op.add_column("punch_correction_requests", sa.Column("attachment_mime", sa.String(length=128), nullable=True))
-    op.add_column("punch_correction_requests", sa.Column("attachment_blob", sa.LargeBinary(), nullable=True))
+    # Batch mode keeps plain ALTERs on PostgreSQL. On SQLite the ADD COLUMNs stay native and
+    # only dropping the reason default rebuilds the table, once, after existing rows got ''.
+    with op.batch_alter_table("leave_requests") as batch_op:
+        batch_op.add_column(sa.Column("reason", sa.Text(), nullable=False, server_default=""))
+        batch_op.add_column(sa.Column("approver_comment", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("attachment_name", sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column("attachment_mime", sa.String(length=128), nullable=True))
+        batch_op.add_column(sa.Column("attachment_blob", sa.LargeBinary(), nullable=True))
+    with op.batch_alter_table("leave_requests") as batch_op:
+        batch_op.alter_column("reason", server_default=None)
+
+    with op.batch_alter_table("punch_correction_requests") as batch_op:
+        batch_op.add_column(sa.Column("approver_comment", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("attachment_name", sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column("attachment_mime", sa.String(length=128), nullable=True))
+        batch_op.add_column(sa.Column("attachment_blob", sa.LargeBinary(), nullable=True))
 
 
 def downgrade() -> None:
-    op.drop_column("punch_correction_requests", "attachment_blob")
-    op.drop_column("punch_correction_requests", "attachment_mime")
-    op.drop_column("punch_correction_requests", "attachment_name")
-    op.drop_column("punch_correction_requests", "approver_comment")
-
-    op.drop_column("leave_requests", "attachment_blob")
-    op.drop_column("leave_requests", "attachment_mime")
-    op.drop_column("leave_requests", "attachment_name")
-    op.drop_column("leave_requests", "approver_comment")
-    op.drop_column("leave_requests", "reason")
+    with op.batch_alter_table("punch_correction_requests") as batch_op:
+        batch_op.drop_column("attachment_blob")
+        batch_op.drop_column("attachment_mime")
+        batch_op.drop_column("attachment_name")
+        batch_op.drop_column("approver_comment")
+
+    with op.batch_alter_table("leave_requests") as batch_op:
+        batch_op.drop_column("attachment_blob")
+        batch_op.drop_column("attachment_mime")
+        batch_op.drop_column("attachment_name")
+        batch_op.drop_column("approver_comment")
+        batch_op.drop_column("reason")
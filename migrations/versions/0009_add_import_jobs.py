@@ -45,11 +45,11 @@ def upgrade() -> None:
         sa.Column("id", sa.Uuid(), nullable=False),
         sa.Column("tenant_id", sa.Uuid(), nullable=False),
         sa.Column("created_by_user_id", sa.Uuid(), nullable=True),
-        sa.Column("status", status_column, nullable=False, server_default=sa.text("'PREVIEWED'")),
+        sa.Column("status", status_column, nullable=False),
         sa.Column("filename", sa.String(length=255), nullable=False),
-        sa.Column("rows_json", sa.JSON(), nullable=False, server_default=sa.text("'[]'::json" if bind.dialect.name == "postgresql" else "'[]'")),
-        sa.Column("errors_json", sa.JSON(), nullable=False, server_default=sa.text("'[]'::json" if bind.dialect.name == "postgresql" else "'[]'")),
-        sa.Column("summary_json", sa.JSON(), nullable=False, server_default=sa.text("'{}'::json" if bind.dialect.name == "postgresql" else "'{}'")),
+        sa.Column("rows_json", sa.JSON(), nullable=False),
+        sa.Column("errors_json", sa.JSON(), nullable=False),
+        sa.Column("summary_json", sa.JSON(), nullable=False),
         sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
         sa.Column("committed_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
@@ -60,11 +60,6 @@ def upgrade() -> None:
     op.create_index("ix_import_jobs_tenant_status", "import_jobs", ["tenant_id", "status"], unique=False)
     op.create_index("ix_import_jobs_tenant_expires", "import_jobs", ["tenant_id", "expires_at"], unique=False)
 
-    op.alter_column("import_jobs", "status", server_default=None)
-    op.alter_column("import_jobs", "rows_json", server_default=None)
-    op.alter_column("import_jobs", "errors_json", server_default=None)
-    op.alter_column("import_jobs", "summary_json", server_default=None)
-
 
 def downgrade() -> None:
     bind = op.get_bind()
@@ -0,0 +1,54 @@
+"""Cover time event type and source in the tenant/employee/ts index.
+
+Revision ID: 0010_time_events_covering_idx
+Revises: 0009_add_import_jobs
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+
+revision: str = "0010_time_events_covering_idx"
+down_revision: str | None = "0009_add_import_jobs"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_INDEX = "ix_time_events_tenant_employee_ts"
+_REPLACEMENT_INDEX = "ix_time_events_tenant_employee_ts_new"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    _swap_index(postgresql_include=["type", "source"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    _swap_index(postgresql_include=[])
+
+
+def _swap_index(postgresql_include: list[str]) -> None:
+    # Build the replacement first and rename it into place, so time_events always keeps a
+    # usable (tenant_id, employee_id, ts) index and an interrupted run can simply be retried.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            _REPLACEMENT_INDEX,
+            "time_events",
+            ["tenant_id", "employee_id", "ts"],
+            unique=False,
+            postgresql_include=postgresql_include,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(_INDEX, table_name="time_events", postgresql_concurrently=True, if_exists=True)
+        op.execute(f"ALTER INDEX {_REPLACEMENT_INDEX} RENAME TO {_INDEX}")
@@ -0,0 +1,50 @@
+"""Enforce append-only time events with a database trigger.
+
+Revision ID: 0011_time_events_append_only
+Revises: 0010_time_events_covering_idx
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+
+revision: str = "0011_time_events_append_only"
+down_revision: str | None = "0010_time_events_covering_idx"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION raise_append_only() RETURNS trigger AS $$
+        BEGIN
+            RAISE EXCEPTION '% are append-only', TG_TABLE_NAME;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER time_events_append_only
+        BEFORE UPDATE OR DELETE ON time_events
+        FOR EACH ROW EXECUTE FUNCTION raise_append_only()
+        """
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS time_events_append_only ON time_events")
+    op.execute("DROP FUNCTION IF EXISTS raise_append_only()")
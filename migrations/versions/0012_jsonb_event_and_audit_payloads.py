@@ -0,0 +1,78 @@
+"""Store time event metadata and audit payloads as JSONB.
+
+Revision ID: 0012_jsonb_payloads
+Revises: 0011_time_events_append_only
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "0012_jsonb_payloads"
+down_revision: str | None = "0011_time_events_append_only"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "time_events",
+        "meta_json",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="meta_json::jsonb",
+    )
+    op.alter_column(
+        "audit_log",
+        "payload_json",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="payload_json::jsonb",
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_log_payload_gin",
+            "audit_log",
+            ["payload_json"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_audit_log_payload_gin", table_name="audit_log", postgresql_concurrently=True, if_exists=True)
+    op.alter_column(
+        "audit_log",
+        "payload_json",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="payload_json::json",
+    )
+    op.alter_column(
+        "time_events",
+        "meta_json",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="meta_json::json",
+    )
@@ -0,0 +1,38 @@
+"""Add a partial index for the pending leave request queue.
+
+Revision ID: 0013_leave_requests_pending
+Revises: 0012_jsonb_payloads
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0013_leave_requests_pending"
+down_revision: str | None = "0012_jsonb_payloads"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_leave_requests_pending",
+            "leave_requests",
+            ["tenant_id", "created_at"],
+            unique=False,
+            postgresql_where=sa.text("status = 'REQUESTED'"),
+            sqlite_where=sa.text("status = 'REQUESTED'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_leave_requests_pending", table_name="leave_requests", postgresql_concurrently=True, if_exists=True)
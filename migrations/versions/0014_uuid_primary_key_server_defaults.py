@@ -0,0 +1,57 @@
+"""Generate UUID primary keys server-side when an insert omits them.
+
+Revision ID: 0014_uuid_pk_server_defaults
+Revises: 0013_leave_requests_pending
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0014_uuid_pk_server_defaults"
+down_revision: str | None = "0013_leave_requests_pending"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+TABLES = (
+    "tenants",
+    "users",
+    "memberships",
+    "sites",
+    "employees",
+    "shifts",
+    "employee_shift_assignments",
+    "time_events",
+    "punch_correction_requests",
+    "time_event_supersessions",
+    "time_adjustments",
+    "leave_types",
+    "shift_leave_policies",
+    "leave_requests",
+    "audit_log",
+    "import_jobs",
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        op.alter_column(table, "id", existing_type=sa.Uuid(), server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        op.alter_column(table, "id", existing_type=sa.Uuid(), server_default=None)
@@ -0,0 +1,35 @@
+"""Index time events by tenant and timestamp for cross-employee reports.
+
+Revision ID: 0015_time_events_tenant_ts
+Revises: 0014_uuid_pk_server_defaults
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+
+revision: str = "0015_time_events_tenant_ts"
+down_revision: str | None = "0014_uuid_pk_server_defaults"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_time_events_tenant_ts",
+            "time_events",
+            ["tenant_id", "ts"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_time_events_tenant_ts", table_name="time_events", postgresql_concurrently=True, if_exists=True)
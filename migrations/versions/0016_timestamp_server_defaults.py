@@ -0,0 +1,53 @@
+"""Fill creation timestamps server-side when an insert omits them.
+
+Revision ID: 0016_timestamp_server_defaults
+Revises: 0015_time_events_tenant_ts
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0016_timestamp_server_defaults"
+down_revision: str | None = "0015_time_events_tenant_ts"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+COLUMNS = (
+    ("users", "created_at"),
+    ("employees", "active_status_changed_at"),
+    ("shifts", "created_at"),
+    ("employee_shift_assignments", "created_at"),
+    ("time_events", "ts"),
+    ("punch_correction_requests", "created_at"),
+    ("time_event_supersessions", "created_at"),
+    ("time_adjustments", "created_at"),
+    ("shift_leave_policies", "created_at"),
+    ("leave_requests", "created_at"),
+    ("audit_log", "ts"),
+    ("import_jobs", "created_at"),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table_name, column_name in COLUMNS:
+        op.alter_column(table_name, column_name, existing_type=sa.DateTime(timezone=True), server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table_name, column_name in COLUMNS:
+        op.alter_column(table_name, column_name, existing_type=sa.DateTime(timezone=True), server_default=None)
@@ -0,0 +1,36 @@
+"""Drop indexes that duplicate a unique constraint on the same columns.
+
+Revision ID: 0017_drop_redundant_indexes
+Revises: 0016_timestamp_server_defaults
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+
+revision: str = "0017_drop_redundant_indexes"
+down_revision: str | None = "0016_timestamp_server_defaults"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+# (index name, table, columns) - each is covered by uq_<table>_... on the same columns.
+INDEXES = (
+    ("ix_memberships_tenant_user", "memberships", ["tenant_id", "user_id"]),
+    ("ix_shifts_tenant_name", "shifts", ["tenant_id", "name"]),
+    ("ix_leave_types_tenant_code", "leave_types", ["tenant_id", "code"]),
+)
+
+
+def upgrade() -> None:
+    for index_name, table_name, _columns in INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+    for index_name, table_name, columns in INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
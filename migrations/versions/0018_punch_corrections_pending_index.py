@@ -0,0 +1,43 @@
+"""Add a partial index for the pending punch correction queue.
+
+Revision ID: 0018_punch_corrections_pending
+Revises: 0017_drop_redundant_indexes
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0018_punch_corrections_pending"
+down_revision: str | None = "0017_drop_redundant_indexes"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_punch_correction_requests_pending",
+            "punch_correction_requests",
+            ["tenant_id", "created_at"],
+            unique=False,
+            postgresql_where=sa.text("status = 'REQUESTED'"),
+            sqlite_where=sa.text("status = 'REQUESTED'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_punch_correction_requests_pending",
+            table_name="punch_correction_requests",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
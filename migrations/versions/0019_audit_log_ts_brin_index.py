@@ -0,0 +1,50 @@
+"""Replace the audit log (tenant_id, ts) B-tree with a BRIN index on ts.
+
+Revision ID: 0019_audit_log_ts_brin
+Revises: 0018_punch_corrections_pending
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+
+revision: str = "0019_audit_log_ts_brin"
+down_revision: str | None = "0018_punch_corrections_pending"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        if bind.dialect.name == "postgresql":
+            op.create_index(
+                "ix_audit_log_ts_brin",
+                "audit_log",
+                ["ts"],
+                unique=False,
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index("ix_audit_log_tenant_ts", table_name="audit_log", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_log_tenant_ts",
+            "audit_log",
+            ["tenant_id", "ts"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        if bind.dialect.name == "postgresql":
+            op.drop_index("ix_audit_log_ts_brin", table_name="audit_log", postgresql_concurrently=True, if_exists=True)
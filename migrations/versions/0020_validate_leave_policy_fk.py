@@ -0,0 +1,32 @@
+"""Validate the leave request policy foreign key added NOT VALID in 0005.
+
+Revision ID: 0020_validate_leave_policy_fk
+Revises: 0019_audit_log_ts_brin
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+
+revision: str = "0020_validate_leave_policy_fk"
+down_revision: str | None = "0019_audit_log_ts_brin"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # A separate revision keeps 0005 atomic; the row scan only holds SHARE UPDATE EXCLUSIVE.
+    op.execute("ALTER TABLE leave_requests VALIDATE CONSTRAINT fk_leave_requests_leave_policy_id")
+
+
+def downgrade() -> None:
+    # A validated constraint cannot be marked NOT VALID again; 0005's downgrade drops it.
+    pass
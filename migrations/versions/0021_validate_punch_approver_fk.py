@@ -0,0 +1,32 @@
+"""Validate the employee punch approver foreign key added NOT VALID in 0007.
+
+Revision ID: 0021_validate_punch_approver_fk
+Revises: 0020_validate_leave_policy_fk
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+
+revision: str = "0021_validate_punch_approver_fk"
+down_revision: str | None = "0020_validate_leave_policy_fk"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # A separate revision keeps 0007 atomic; the row scan only holds SHARE UPDATE EXCLUSIVE.
+    op.execute("ALTER TABLE employees VALIDATE CONSTRAINT fk_employees_punch_approver_user_id")
+
+
+def downgrade() -> None:
+    # A validated constraint cannot be marked NOT VALID again; 0007's downgrade drops it.
+    pass
@@ -1,67 +1,139 @@
 from __future__ import annotations
 
-from typing import Iterator
+from decimal import Decimal
+from typing import Callable, Iterator, NamedTuple
 import uuid
 
+from argon2 import PasswordHasher
+from flask import request_tearing_down
 import pytest
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event, insert
+from sqlalchemy.pool import QueuePool
 
 from app import create_app
 from app.config import Config
 from app.extensions import db
-from app.models import Employee, Membership, MembershipRole, Tenant, User
-from app.security import hash_secret
+from app.models import Employee, ExpectedHoursFrequency, Membership, MembershipRole, Shift, Tenant, User
+from app import security
 
 
 class TestConfig(Config):
     TESTING = True
     WTF_CSRF_ENABLED = False
-    SQLALCHEMY_DATABASE_URI = "sqlite+pysqlite:///:memory:"
+    # Named shared-cache memory DB: every pooled connection sees the same schema and rows.
+    SQLALCHEMY_DATABASE_URI = "sqlite+pysqlite:///file:ctrlhorario_test?mode=memory&cache=shared&uri=true"
     SQLALCHEMY_ENGINE_OPTIONS = {
-        "connect_args": {"check_same_thread": False},
-        "poolclass": StaticPool,
+        "connect_args": {"uri": True, "check_same_thread": False},
+        "poolclass": QueuePool,
+        "pool_size": 5,
+        "max_overflow": 0,
     }
 
 
-@pytest.fixture()
-def app() -> Iterator:
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hasher() -> Iterator[None]:
+    # Production Argon2id parameters cost ~100 ms per hash or verify; the lowest legal ones
+    # still produce real $argon2id$ hashes, so rehash and legacy-upgrade paths behave the same.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(security, "_password_hasher", PasswordHasher(time_cost=1, memory_cost=8, parallelism=1))
+        yield
+
+
+@pytest.fixture(scope="session")
+def fixture_password_hash(_fast_password_hasher) -> str:
+    # Hash the shared fixture password once per run.
+    return security.hash_secret("password123")
+
+
+@pytest.fixture(scope="session")
+def _seeded_app(fixture_password_hash) -> Iterator:
     app = create_app(TestConfig)
     with app.app_context():
+        engine = db.engine
+
+        # pysqlite defers BEGIN and autocommits DDL; take over transaction control so
+        # SAVEPOINTs nest properly and per-test rollbacks also undo schema changes.
+        @event.listens_for(engine, "connect")
+        def configure_sqlite_connection(dbapi_connection, _connection_record) -> None:
+            dbapi_connection.isolation_level = None
+            # The database only lives in memory, so durability bookkeeping is pure overhead.
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+
+        @event.listens_for(engine, "begin")
+        def emit_begin(connection) -> None:
+            connection.exec_driver_sql("BEGIN")
+
+        # SQLite frees a shared-cache memory DB once its last connection closes.
+        keepalive = engine.connect()
         db.create_all()
 
-        tenant_a = Tenant(id=uuid.uuid4(), name="Tenant A", slug="tenant-a")
-        tenant_b = Tenant(id=uuid.uuid4(), name="Tenant B", slug="tenant-b")
-        user = User(id=uuid.uuid4(), email="owner@example.com", password_hash=hash_secret("password123"), is_active=True)
-        employee_a = Employee(
-            id=uuid.uuid4(),
-            tenant_id=tenant_a.id,
-            name="Owner Employee",
-            email="employee@example.com",
-            active=True,
+        # Bulk INSERTs per table, parents first; the seed is never read back through the ORM.
+        tenant_a_id, tenant_b_id, user_id, employee_a_id = (uuid.uuid4() for _ in range(4))
+        db.session.execute(
+            insert(Tenant),
+            [
+                {"id": tenant_a_id, "name": "Tenant A", "slug": "tenant-a"},
+                {"id": tenant_b_id, "name": "Tenant B", "slug": "tenant-b"},
+            ],
         )
-
-        db.session.add_all([tenant_a, tenant_b, user, employee_a])
-        db.session.flush()
-        db.session.add_all(
+        db.session.execute(
+            insert(User),
+            [{"id": user_id, "email": "owner@example.com", "password_hash": fixture_password_hash, "is_active": True}],
+        )
+        db.session.execute(
+            insert(Employee),
+            [
+                {
+                    "id": employee_a_id,
+                    "tenant_id": tenant_a_id,
+                    "name": "Owner Employee",
+                    "email": "employee@example.com",
+                    "active": True,
+                }
+            ],
+        )
+        db.session.execute(
+            insert(Membership),
             [
-                Membership(
-                    tenant_id=tenant_a.id,
-                    user_id=user.id,
-                    role=MembershipRole.OWNER,
-                    employee_id=employee_a.id,
-                ),
-                Membership(
-                    tenant_id=tenant_b.id,
-                    user_id=user.id,
-                    role=MembershipRole.OWNER,
-                    employee_id=None,
-                ),
-            ]
+                {"tenant_id": tenant_a_id, "user_id": user_id, "role": MembershipRole.OWNER, "employee_id": employee_a_id},
+                {"tenant_id": tenant_b_id, "user_id": user_id, "role": MembershipRole.OWNER, "employee_id": None},
+            ],
         )
         db.session.commit()
-        yield app
         db.session.remove()
-        db.drop_all()
+    yield app
+    with app.app_context():
+        keepalive.close()
+        db.engine.dispose()
+
+
+def _end_request_transaction(_sender, **_extra) -> None:
+    db.session.rollback()
+
+
+@pytest.fixture()
+def app(_seeded_app, monkeypatch) -> Iterator:
+    # Each test runs inside one outer transaction that is rolled back afterwards; session
+    # commits only release SAVEPOINTs, so the seeded schema and rows are shared by the run.
+    with _seeded_app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        monkeypatch.setitem(db.engines, None, connection)
+        db.session.remove()
+        db.session.configure(join_transaction_mode="create_savepoint")
+        # Requests reuse this app context and its session. End the request's SAVEPOINT with the
+        # request, as production teardown does; left open, a later rollback to it would also
+        # discard rows committed by other sessions in the meantime.
+        with request_tearing_down.connected_to(_end_request_transaction, _seeded_app):
+            yield _seeded_app
+        db.session.remove()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture()
@@ -69,14 +141,19 @@ def client(app):
     return app.test_client()
 
 
+class AdminAccount(NamedTuple):
+    tenant_id: uuid.UUID
+    user_id: uuid.UUID
+
+
 @pytest.fixture()
-def admin_only_client(app):
+def admin_account(app, fixture_password_hash) -> AdminAccount:
     with app.app_context():
         tenant = Tenant(id=uuid.uuid4(), name="Admin Tenant", slug="admin-tenant")
         user = User(
             id=uuid.uuid4(),
             email="admin@example.com",
-            password_hash=hash_secret("password123"),
+            password_hash=fixture_password_hash,
             is_active=True,
         )
         db.session.add_all([tenant, user])
@@ -89,6 +166,53 @@ def admin_only_client(app):
                 employee_id=None,
             )
         )
+        account = AdminAccount(tenant_id=tenant.id, user_id=user.id)
         db.session.commit()
+    return account
+
 
+@pytest.fixture()
+def admin_only_client(app, admin_account):
     return app.test_client()
+
+
+@pytest.fixture()
+def admin_client(admin_only_client, admin_account):
+    # Same session state a successful /login leaves for the single-tenant admin, without the
+    # POST and the Argon2 verification.
+    with admin_only_client.session_transaction() as flask_session:
+        flask_session["_user_id"] = str(admin_account.user_id)
+        flask_session["_fresh"] = True
+        flask_session["active_tenant_id"] = str(admin_account.tenant_id)
+    return admin_only_client
+
+
+@pytest.fixture()
+def make_shift(app) -> Callable[..., uuid.UUID]:
+    # Seed rows directly when a test only needs them to exist, not to go through the form.
+    def _make_shift(tenant_id: uuid.UUID, **values) -> uuid.UUID:
+        values.setdefault("name", "General")
+        values.setdefault("break_counts_as_worked_bool", True)
+        values.setdefault("break_minutes", 30)
+        values.setdefault("expected_hours", Decimal("7.50"))
+        values.setdefault("expected_hours_frequency", ExpectedHoursFrequency.DAILY)
+        with app.app_context():
+            shift = Shift(tenant_id=tenant_id, **values)
+            db.session.add(shift)
+            db.session.commit()
+            return shift.id
+
+    return _make_shift
+
+
+@pytest.fixture()
+def make_employee(app) -> Callable[..., uuid.UUID]:
+    def _make_employee(tenant_id: uuid.UUID, **values) -> uuid.UUID:
+        values.setdefault("active", True)
+        with app.app_context():
+            employee = Employee(tenant_id=tenant_id, **values)
+            db.session.add(employee)
+            db.session.commit()
+            return employee.id
+
+    return _make_employee
@@ -1,39 +1,19 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
 
 from sqlalchemy import select, text
 
 from app.extensions import db
-from app.models import Employee, EmployeeShiftAssignment, Shift
+from app.models import Employee, EmployeeShiftAssignment
 
 
-def _login_admin(client):
-    return client.post(
-        "/login",
-        data={"email": "admin@example.com", "password": "password123"},
-        follow_redirects=False,
-    )
-
-
-def test_admin_can_edit_employee_and_assign_shift(admin_only_client):
-    login_response = _login_admin(admin_only_client)
-    assert login_response.status_code == 302
-
-    create_shift = admin_only_client.post(
-        "/admin/turnos/new",
-        data={
-            "name": "General",
-            "break_counts_as_worked_bool": "y",
-            "break_minutes": "30",
-            "expected_hours": "7.5",
-            "expected_hours_frequency": "DAILY",
-        },
-        follow_redirects=False,
-    )
-    assert create_shift.status_code == 302
+def test_admin_can_edit_employee_and_assign_shift(admin_client, admin_account, make_shift):
+    shift_id = make_shift(admin_account.tenant_id, name="General")
 
-    create_employee = admin_only_client.post(
+    create_employee = admin_client.post(
         "/admin/employees/new",
         data={
             "name": "Empleado Uno",
@@ -44,14 +24,10 @@ def test_admin_can_edit_employee_and_assign_shift(admin_only_client):
         follow_redirects=False,
     )
     assert create_employee.status_code == 302
+    assert create_employee.headers["Location"].endswith("/edit")
+    employee_id = UUID(create_employee.headers["Location"].rsplit("/", 2)[-2])
 
-    with admin_only_client.application.app_context():
-        employee = db.session.execute(select(Employee).where(Employee.email == "uno@example.com")).scalar_one()
-        shift = db.session.execute(select(Shift).where(Shift.name == "General")).scalar_one()
-        employee_id = employee.id
-        shift_id = shift.id
-
-    update_employee = admin_only_client.post(
+    update_employee = admin_client.post(
         f"/admin/employees/{employee_id}/edit",
         data={
             "name": "Empleado Editado",
@@ -67,7 +43,7 @@ def test_admin_can_edit_employee_and_assign_shift(admin_only_client):
     assert "Empleado actualizado." in body
     assert "Historial de turnos" in body
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         updated_employee = db.session.get(Employee, employee_id)
         assert updated_employee is not None
         assert updated_employee.name == "Empleado Editado"
@@ -81,76 +57,41 @@ def test_admin_can_edit_employee_and_assign_shift(admin_only_client):
         assert assignment.effective_to is None
 
 
-def test_admin_shift_reassignment_closes_previous_period(admin_only_client):
-    _login_admin(admin_only_client)
-    admin_only_client.post(
-        "/admin/turnos/new",
-        data={
-            "name": "General",
-            "break_counts_as_worked_bool": "y",
-            "break_minutes": "30",
-            "expected_hours": "7.5",
-            "expected_hours_frequency": "DAILY",
-        },
-        follow_redirects=False,
-    )
-    admin_only_client.post(
-        "/admin/turnos/new",
-        data={
-            "name": "Parcial",
-            "break_counts_as_worked_bool": "y",
-            "break_minutes": "20",
-            "expected_hours": "4",
-            "expected_hours_frequency": "DAILY",
-        },
-        follow_redirects=False,
-    )
-    admin_only_client.post(
-        "/admin/employees/new",
-        data={
-            "name": "Empleado Dos",
-            "email": "dos@example.com",
-            "pin": "1234",
-            "active": "y",
-        },
-        follow_redirects=False,
-    )
-
-    with admin_only_client.application.app_context():
-        employee = db.session.execute(select(Employee).where(Employee.email == "dos@example.com")).scalar_one()
-        general = db.session.execute(select(Shift).where(Shift.name == "General")).scalar_one()
-        parcial = db.session.execute(select(Shift).where(Shift.name == "Parcial")).scalar_one()
-        employee_id = employee.id
+def test_admin_shift_reassignment_closes_previous_period(admin_client, admin_account, make_shift, make_employee):
+    tenant_id = admin_account.tenant_id
+    general_id = make_shift(tenant_id, name="General")
+    parcial_id = make_shift(tenant_id, name="Parcial", break_minutes=20, expected_hours=Decimal("4"))
+    employee_id = make_employee(tenant_id, name="Empleado Dos", email="dos@example.com")
 
-    first_assignment = admin_only_client.post(
+    first_assignment = admin_client.post(
         f"/admin/employees/{employee_id}/edit",
         data={
             "name": "Empleado Dos",
             "email": "dos@example.com",
             "pin": "",
             "active": "y",
-            "assignment_shift_id": str(general.id),
+            "assignment_shift_id": str(general_id),
             "assignment_effective_from": "2026-02-01",
         },
         follow_redirects=False,
     )
     assert first_assignment.status_code == 302
 
-    second_assignment = admin_only_client.post(
+    second_assignment = admin_client.post(
         f"/admin/employees/{employee_id}/edit",
         data={
             "name": "Empleado Dos",
             "email": "dos@example.com",
             "pin": "",
             "active": "y",
-            "assignment_shift_id": str(parcial.id),
+            "assignment_shift_id": str(parcial_id),
             "assignment_effective_from": "2026-02-16",
         },
         follow_redirects=False,
     )
     assert second_assignment.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         rows = list(
             db.session.execute(
                 select(EmployeeShiftAssignment)
@@ -161,51 +102,28 @@ def test_admin_shift_reassignment_closes_previous_period(admin_only_client):
             .all()
         )
         assert len(rows) == 2
-        assert rows[0].shift_id == general.id
+        assert rows[0].shift_id == general_id
         assert rows[0].effective_from == date(2026, 2, 1)
         assert rows[0].effective_to == date(2026, 2, 15)
-        assert rows[1].shift_id == parcial.id
+        assert rows[1].shift_id == parcial_id
         assert rows[1].effective_from == date(2026, 2, 16)
         assert rows[1].effective_to is None
 
 
-def test_admin_employee_edit_does_not_500_when_assignment_table_is_missing(admin_only_client):
-    _login_admin(admin_only_client)
-    admin_only_client.post(
-        "/admin/turnos/new",
-        data={
-            "name": "General",
-            "break_counts_as_worked_bool": "y",
-            "break_minutes": "30",
-            "expected_hours": "7.5",
-            "expected_hours_frequency": "DAILY",
-        },
-        follow_redirects=False,
-    )
-    admin_only_client.post(
-        "/admin/employees/new",
-        data={
-            "name": "Empleado Tres",
-            "email": "tres@example.com",
-            "pin": "1234",
-            "active": "y",
-        },
-        follow_redirects=False,
-    )
+def test_admin_employee_edit_does_not_500_when_assignment_table_is_missing(admin_client, admin_account, make_shift, make_employee):
+    tenant_id = admin_account.tenant_id
+    shift_id = make_shift(tenant_id, name="General")
+    employee_id = make_employee(tenant_id, name="Empleado Tres", email="tres@example.com")
 
-    with admin_only_client.application.app_context():
-        employee = db.session.execute(select(Employee).where(Employee.email == "tres@example.com")).scalar_one()
-        shift = db.session.execute(select(Shift).where(Shift.name == "General")).scalar_one()
-        employee_id = employee.id
-        shift_id = shift.id
+    with admin_client.application.app_context():
         db.session.execute(text("DROP TABLE employee_shift_assignments"))
         db.session.commit()
 
-    edit_page = admin_only_client.get(f"/admin/employees/{employee_id}/edit", follow_redirects=True)
+    edit_page = admin_client.get(f"/admin/employees/{employee_id}/edit", follow_redirects=True)
     assert edit_page.status_code == 200
     assert "No se pudo cargar el historial de turnos del empleado." in edit_page.get_data(as_text=True)
 
-    submit = admin_only_client.post(
+    submit = admin_client.post(
         f"/admin/employees/{employee_id}/edit",
         data={
             "name": "Empleado Tres",
@@ -222,40 +140,18 @@ def test_admin_employee_edit_does_not_500_when_assignment_table_is_missing(admin
     assert "No se pudo actualizar turno. Revisa migraciones pendientes" in body
 
 
-def test_employee_shift_history_hides_migration_sentinel_date(admin_only_client):
-    _login_admin(admin_only_client)
-    admin_only_client.post(
-        "/admin/turnos/new",
-        data={
-            "name": "General",
-            "break_counts_as_worked_bool": "y",
-            "break_minutes": "30",
-            "expected_hours": "7.5",
-            "expected_hours_frequency": "DAILY",
-        },
-        follow_redirects=False,
-    )
-    admin_only_client.post(
-        "/admin/employees/new",
-        data={
-            "name": "Empleado Cuatro",
-            "email": "cuatro@example.com",
-            "pin": "1234",
-            "active": "y",
-        },
-        follow_redirects=False,
-    )
+def test_employee_shift_history_hides_migration_sentinel_date(admin_client, admin_account, make_shift, make_employee):
+    tenant_id = admin_account.tenant_id
+    shift_id = make_shift(tenant_id, name="General")
+    employee_id = make_employee(tenant_id, name="Empleado Cuatro", email="cuatro@example.com")
 
-    with admin_only_client.application.app_context():
-        employee = db.session.execute(select(Employee).where(Employee.email == "cuatro@example.com")).scalar_one()
-        shift = db.session.execute(select(Shift).where(Shift.name == "General")).scalar_one()
-        employee_id = employee.id
+    with admin_client.application.app_context():
         initial_created_at = datetime(2026, 2, 5, 10, 30)
         db.session.add(
             EmployeeShiftAssignment(
-                tenant_id=employee.tenant_id,
-                employee_id=employee.id,
-                shift_id=shift.id,
+                tenant_id=tenant_id,
+                employee_id=employee_id,
+                shift_id=shift_id,
                 effective_from=date(1970, 1, 1),
                 effective_to=None,
                 created_at=initial_created_at,
@@ -263,42 +159,25 @@ def test_employee_shift_history_hides_migration_sentinel_date(admin_only_client)
         )
         db.session.commit()
 
-    page = admin_only_client.get(f"/admin/employees/{employee_id}/edit", follow_redirects=True)
+    page = admin_client.get(f"/admin/employees/{employee_id}/edit", follow_redirects=True)
     assert page.status_code == 200
     body = page.get_data(as_text=True)
     assert "05/02/2026" in body
     assert "01/01/1970" not in body
 
 
-def test_employees_list_groups_inactive_in_collapsible_section(admin_only_client):
-    _login_admin(admin_only_client)
-    admin_only_client.post(
-        "/admin/employees/new",
-        data={
-            "name": "Empleado Activo",
-            "email": "activo@example.com",
-            "pin": "1234",
-            "active": "y",
-        },
-        follow_redirects=False,
-    )
-    admin_only_client.post(
-        "/admin/employees/new",
-        data={
-            "name": "Empleado Inactivo",
-            "email": "inactivo@example.com",
-            "pin": "1234",
-        },
-        follow_redirects=False,
+def test_employees_list_groups_inactive_in_collapsible_section(admin_client, admin_account, make_employee):
+    tenant_id = admin_account.tenant_id
+    make_employee(tenant_id, name="Empleado Activo", email="activo@example.com")
+    make_employee(
+        tenant_id,
+        name="Empleado Inactivo",
+        email="inactivo@example.com",
+        active=False,
+        active_status_changed_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
     )
 
-    with admin_only_client.application.app_context():
-        inactive_employee = db.session.execute(select(Employee).where(Employee.email == "inactivo@example.com")).scalar_one()
-        inactive_employee.active = False
-        inactive_employee.active_status_changed_at = datetime(2026, 2, 1, tzinfo=timezone.utc)
-        db.session.commit()
-
-    page = admin_only_client.get("/admin/employees", follow_redirects=True)
+    page = admin_client.get("/admin/employees", follow_redirects=True)
     assert page.status_code == 200
     body = page.get_data(as_text=True)
 
@@ -314,27 +193,16 @@ def test_employees_list_groups_inactive_in_collapsible_section(admin_only_client
     assert active_pos < accordion_pos < inactive_pos
 
 
-def test_employee_active_status_changed_at_updates_when_active_flag_changes(admin_only_client):
-    _login_admin(admin_only_client)
-    admin_only_client.post(
-        "/admin/employees/new",
-        data={
-            "name": "Empleado Estado",
-            "email": "estado@example.com",
-            "pin": "1234",
-            "active": "y",
-        },
-        follow_redirects=False,
+def test_employee_active_status_changed_at_updates_when_active_flag_changes(admin_client, admin_account, make_employee):
+    baseline = datetime(2020, 1, 1)
+    employee_id = make_employee(
+        admin_account.tenant_id,
+        name="Empleado Estado",
+        email="estado@example.com",
+        active_status_changed_at=baseline,
     )
 
-    with admin_only_client.application.app_context():
-        employee = db.session.execute(select(Employee).where(Employee.email == "estado@example.com")).scalar_one()
-        employee_id = employee.id
-        baseline = datetime(2020, 1, 1)
-        employee.active_status_changed_at = baseline
-        db.session.commit()
-
-    same_status = admin_only_client.post(
+    same_status = admin_client.post(
         f"/admin/employees/{employee_id}/edit",
         data={
             "name": "Empleado Estado",
@@ -348,13 +216,13 @@ def test_employee_active_status_changed_at_updates_when_active_flag_changes(admi
     )
     assert same_status.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         employee = db.session.get(Employee, employee_id)
         assert employee is not None
         assert employee.active is True
         assert employee.active_status_changed_at == baseline
 
-    to_inactive = admin_only_client.post(
+    to_inactive = admin_client.post(
         f"/admin/employees/{employee_id}/edit",
         data={
             "name": "Empleado Estado",
@@ -367,14 +235,14 @@ def test_employee_active_status_changed_at_updates_when_active_flag_changes(admi
     )
     assert to_inactive.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         employee = db.session.get(Employee, employee_id)
         assert employee is not None
         assert employee.active is False
         assert employee.active_status_changed_at > baseline
         inactive_changed_at = employee.active_status_changed_at
 
-    to_active = admin_only_client.post(
+    to_active = admin_client.post(
         f"/admin/employees/{employee_id}/edit",
         data={
             "name": "Empleado Estado",
@@ -388,7 +256,7 @@ def test_employee_active_status_changed_at_updates_when_active_flag_changes(admi
     )
     assert to_active.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         employee = db.session.get(Employee, employee_id)
         assert employee is not None
         assert employee.active is True
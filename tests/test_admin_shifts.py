@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
+from decimal import Decimal
 
 from sqlalchemy import select, text
 
@@ -43,8 +44,7 @@ def test_admin_can_create_shift(admin_only_client):
     assert "Diarias" in body
 
 
-def test_admin_shift_name_must_be_unique(admin_only_client):
-    _login_admin(admin_only_client)
+def test_admin_shift_name_must_be_unique(admin_client):
     payload = {
         "name": "Media jornada",
         "break_minutes": "30",
@@ -52,23 +52,21 @@ def test_admin_shift_name_must_be_unique(admin_only_client):
         "expected_hours_frequency": "DAILY",
     }
 
-    first_response = admin_only_client.post("/admin/turnos/new", data=payload, follow_redirects=False)
+    first_response = admin_client.post("/admin/turnos/new", data=payload, follow_redirects=False)
     assert first_response.status_code == 302
 
-    second_response = admin_only_client.post("/admin/turnos/new", data=payload, follow_redirects=True)
+    second_response = admin_client.post("/admin/turnos/new", data=payload, follow_redirects=True)
     body = second_response.get_data(as_text=True)
     assert second_response.status_code == 200
     assert "Ya existe un turno con ese nombre." in body
 
 
-def test_admin_turnos_page_handles_missing_shifts_table(admin_only_client):
-    _login_admin(admin_only_client)
-
-    with admin_only_client.application.app_context():
+def test_admin_turnos_page_handles_missing_shifts_table(admin_client):
+    with admin_client.application.app_context():
         db.session.execute(text("DROP TABLE shifts"))
         db.session.commit()
 
-    shifts_page = admin_only_client.get("/admin/turnos", follow_redirects=False)
+    shifts_page = admin_client.get("/admin/turnos", follow_redirects=False)
     body = shifts_page.get_data(as_text=True)
 
     assert shifts_page.status_code == 200
@@ -76,26 +74,10 @@ def test_admin_turnos_page_handles_missing_shifts_table(admin_only_client):
     assert "No hay turnos creados." in body
 
 
-def test_admin_can_edit_shift(admin_only_client):
-    _login_admin(admin_only_client)
-    create_response = admin_only_client.post(
-        "/admin/turnos/new",
-        data={
-            "name": "General",
-            "break_counts_as_worked_bool": "y",
-            "break_minutes": "30",
-            "expected_hours": "8",
-            "expected_hours_frequency": "DAILY",
-        },
-        follow_redirects=False,
-    )
-    assert create_response.status_code == 302
-
-    with admin_only_client.application.app_context():
-        shift = db.session.execute(select(Shift).where(Shift.name == "General")).scalar_one()
-        shift_id = shift.id
+def test_admin_can_edit_shift(admin_client, admin_account, make_shift):
+    shift_id = make_shift(admin_account.tenant_id, name="General", expected_hours=Decimal("8"))
 
-    update_response = admin_only_client.post(
+    update_response = admin_client.post(
         f"/admin/turnos/{shift_id}/edit",
         data={
             "name": "General revisado",
@@ -108,7 +90,7 @@ def test_admin_can_edit_shift(admin_only_client):
     assert update_response.status_code == 302
     assert "/admin/turnos" in update_response.headers["Location"]
 
-    shifts_page = admin_only_client.get("/admin/turnos", follow_redirects=False)
+    shifts_page = admin_client.get("/admin/turnos", follow_redirects=False)
     body = shifts_page.get_data(as_text=True)
     assert shifts_page.status_code == 200
     assert "General revisado" in body
@@ -116,26 +98,10 @@ def test_admin_can_edit_shift(admin_only_client):
     assert "Semanales" in body
 
 
-def test_admin_shift_edit_page_contains_leave_policy_section(admin_only_client):
-    _login_admin(admin_only_client)
-    create_response = admin_only_client.post(
-        "/admin/turnos/new",
-        data={
-            "name": "General",
-            "break_counts_as_worked_bool": "y",
-            "break_minutes": "30",
-            "expected_hours": "8",
-            "expected_hours_frequency": "DAILY",
-        },
-        follow_redirects=False,
-    )
-    assert create_response.status_code == 302
+def test_admin_shift_edit_page_contains_leave_policy_section(admin_client, admin_account, make_shift):
+    shift_id = make_shift(admin_account.tenant_id, name="General", expected_hours=Decimal("8"))
 
-    with admin_only_client.application.app_context():
-        shift = db.session.execute(select(Shift).where(Shift.name == "General")).scalar_one()
-        shift_id = shift.id
-
-    edit_page = admin_only_client.get(f"/admin/turnos/{shift_id}/edit", follow_redirects=False)
+    edit_page = admin_client.get(f"/admin/turnos/{shift_id}/edit", follow_redirects=False)
     assert edit_page.status_code == 200
     body = edit_page.get_data(as_text=True)
     assert "Vacaciones permisos" in body
@@ -144,10 +110,8 @@ def test_admin_shift_edit_page_contains_leave_policy_section(admin_only_client):
     assert f'value="{date.today().year}-12-21"' in body
 
 
-def test_admin_shift_new_page_prefills_default_leave_policy_dates(admin_only_client):
-    _login_admin(admin_only_client)
-
-    page = admin_only_client.get("/admin/turnos/new", follow_redirects=False)
+def test_admin_shift_new_page_prefills_default_leave_policy_dates(admin_client):
+    page = admin_client.get("/admin/turnos/new", follow_redirects=False)
     assert page.status_code == 200
     body = page.get_data(as_text=True)
 
@@ -155,9 +119,8 @@ def test_admin_shift_new_page_prefills_default_leave_policy_dates(admin_only_cli
     assert f'value="{date.today().year}-12-21"' in body
 
 
-def test_admin_can_create_shift_with_leave_policy(admin_only_client):
-    _login_admin(admin_only_client)
-    create_response = admin_only_client.post(
+def test_admin_can_create_shift_with_leave_policy(admin_client):
+    create_response = admin_client.post(
         "/admin/turnos/new",
         data={
             "name": "General",
@@ -175,7 +138,7 @@ def test_admin_can_create_shift_with_leave_policy(admin_only_client):
     )
     assert create_response.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         shift = db.session.execute(select(Shift).where(Shift.name == "General")).scalar_one()
         rows = list(
             db.session.execute(select(ShiftLeavePolicy).where(ShiftLeavePolicy.shift_id == shift.id))
@@ -1,72 +1,60 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from sqlalchemy import select
 
 from app.extensions import db
 from app.models import AuditLog, Employee, Membership, MembershipRole, Tenant, User
 
 
-def _login_admin(client):
-    return client.post(
-        "/login",
-        data={"email": "admin@example.com", "password": "password123"},
-        follow_redirects=False,
-    )
-
-
-def _create_employee(admin_only_client, name: str, email: str):
-    response = admin_only_client.post(
+def _create_employee(client, name: str, email: str) -> UUID:
+    response = client.post(
         "/admin/employees/new",
         data={"name": name, "email": email, "pin": "1234", "active": "y"},
         follow_redirects=False,
     )
     assert response.status_code == 302
+    # The create view redirects to the new employee's edit page: /admin/employees/<id>/edit.
+    return UUID(response.headers["Location"].rsplit("/", 2)[-2])
 
 
-def test_admin_can_create_employee_user(admin_only_client):
-    _login_admin(admin_only_client)
-    _create_employee(admin_only_client, "Empleado Usuario", "empleado.usuario@example.com")
-
-    with admin_only_client.application.app_context():
-        employee = db.session.execute(select(Employee).where(Employee.email == "empleado.usuario@example.com")).scalar_one()
+def test_admin_can_create_employee_user(admin_client):
+    employee_id = _create_employee(admin_client, "Empleado Usuario", "empleado.usuario@example.com")
 
-    response = admin_only_client.post(
+    response = admin_client.post(
         "/admin/users/new",
         data={
             "email": "  Nuevo.Usuario@Example.com ",
             "password": "password123",
             "confirm_password": "password123",
             "role": "EMPLOYEE",
-            "employee_id": str(employee.id),
+            "employee_id": str(employee_id),
             "active": "y",
         },
         follow_redirects=False,
     )
     assert response.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         created_user = db.session.execute(select(User).where(User.email == "nuevo.usuario@example.com")).scalar_one()
         assert created_user.is_active is True
         membership = db.session.execute(select(Membership).where(Membership.user_id == created_user.id)).scalar_one()
         assert membership.role == MembershipRole.EMPLOYEE
-        assert membership.employee_id == employee.id
-
+        assert membership.employee_id == employee_id
 
-def test_admin_role_requires_empty_employee(admin_only_client):
-    _login_admin(admin_only_client)
-    _create_employee(admin_only_client, "Empleado Admin", "empleado.admin@example.com")
 
-    with admin_only_client.application.app_context():
-        employee = db.session.execute(select(Employee).where(Employee.email == "empleado.admin@example.com")).scalar_one()
+def test_admin_role_requires_empty_employee(admin_client):
+    employee_id = _create_employee(admin_client, "Empleado Admin", "empleado.admin@example.com")
 
-    response = admin_only_client.post(
+    response = admin_client.post(
         "/admin/users/new",
         data={
             "email": "admin.extra@example.com",
             "password": "password123",
             "confirm_password": "password123",
             "role": "ADMIN",
-            "employee_id": str(employee.id),
+            "employee_id": str(employee_id),
             "active": "y",
         },
         follow_redirects=True,
@@ -74,7 +62,7 @@ def test_admin_role_requires_empty_employee(admin_only_client):
     assert response.status_code == 200
     assert "no deben tener empleado asociado" in response.get_data(as_text=True)
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         assert db.session.execute(select(User).where(User.email == "admin.extra@example.com")).scalar_one_or_none() is None
 
 
@@ -94,55 +82,50 @@ def _activate_tenant(client, slug: str) -> None:
         session["active_tenant_id"] = str(tenant_id)
 
 
-def test_admin_can_edit_user_role_status_and_employee(admin_only_client):
-    _login_admin(admin_only_client)
-    _create_employee(admin_only_client, "Empleado Edit", "edit.user@example.com")
-    _create_employee(admin_only_client, "Empleado Dos", "edit.user2@example.com")
+def test_admin_can_edit_user_role_status_and_employee(admin_client):
+    employee_one_id = _create_employee(admin_client, "Empleado Edit", "edit.user@example.com")
+    employee_two_id = _create_employee(admin_client, "Empleado Dos", "edit.user2@example.com")
 
-    with admin_only_client.application.app_context():
-        employee_one = db.session.execute(select(Employee).where(Employee.email == "edit.user@example.com")).scalar_one()
-        employee_two = db.session.execute(select(Employee).where(Employee.email == "edit.user2@example.com")).scalar_one()
-
-    create_response = admin_only_client.post(
+    create_response = admin_client.post(
         "/admin/users/new",
         data={
             "email": "editable@example.com",
             "password": "password123",
             "confirm_password": "password123",
             "role": "EMPLOYEE",
-            "employee_id": str(employee_one.id),
+            "employee_id": str(employee_one_id),
             "active": "y",
         },
         follow_redirects=False,
     )
     assert create_response.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         editable_user = db.session.execute(select(User).where(User.email == "editable@example.com")).scalar_one()
 
-    edit_response = admin_only_client.post(
+    edit_response = admin_client.post(
         f"/admin/users/{editable_user.id}/edit",
         data={
             "role": "EMPLOYEE",
-            "employee_id": str(employee_two.id),
+            "employee_id": str(employee_two_id),
         },
         follow_redirects=False,
     )
     assert edit_response.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         membership = db.session.execute(select(Membership).where(Membership.user_id == editable_user.id)).scalar_one()
         user = db.session.get(User, editable_user.id)
         assert membership.role == MembershipRole.EMPLOYEE
-        assert membership.employee_id == employee_two.id
+        assert membership.employee_id == employee_two_id
         assert user is not None
         assert user.is_active is False
 
         role_audit = db.session.execute(
             select(AuditLog).where(AuditLog.action == "USER_ROLE_CHANGED").order_by(AuditLog.ts.desc())
         ).scalar_one()
-        assert role_audit.payload_json["before"]["employee_id"] == str(employee_one.id)
-        assert role_audit.payload_json["after"]["employee_id"] == str(employee_two.id)
+        assert role_audit.payload_json["before"]["employee_id"] == str(employee_one_id)
+        assert role_audit.payload_json["after"]["employee_id"] == str(employee_two_id)
 
         status_audit = db.session.execute(
             select(AuditLog).where(AuditLog.action == "USER_STATUS_CHANGED").order_by(AuditLog.ts.desc())
@@ -151,10 +134,8 @@ def test_admin_can_edit_user_role_status_and_employee(admin_only_client):
         assert status_audit.payload_json["after"]["is_active"] is False
 
 
-def test_admin_cannot_change_owner_role(admin_only_client):
-    _login_admin(admin_only_client)
-
-    with admin_only_client.application.app_context():
+def test_admin_cannot_change_owner_role(admin_client):
+    with admin_client.application.app_context():
         tenant_id = db.session.execute(select(Membership.tenant_id).where(Membership.role == MembershipRole.ADMIN)).scalar_one()
         owner_user = User(email="tenant.owner@example.com", password_hash="x", is_active=True)
         db.session.add(owner_user)
@@ -163,7 +144,7 @@ def test_admin_cannot_change_owner_role(admin_only_client):
         db.session.commit()
         owner_id = owner_user.id
 
-    response = admin_only_client.post(
+    response = admin_client.post(
         f"/admin/users/{owner_id}/edit",
         data={"role": "ADMIN", "employee_id": "", "active": "y"},
         follow_redirects=True,
@@ -171,7 +152,7 @@ def test_admin_cannot_change_owner_role(admin_only_client):
     assert response.status_code == 200
     assert "Solo OWNER puede cambiar asignaciones de OWNER" in response.get_data(as_text=True)
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         membership = db.session.execute(select(Membership).where(Membership.user_id == owner_id)).scalar_one()
         assert membership.role == MembershipRole.OWNER
 
@@ -208,10 +189,8 @@ def test_user_cannot_remove_own_last_admin_access(client):
         assert tenant_b_membership.role == MembershipRole.OWNER
 
 
-def test_admin_can_force_reset_user_password(admin_only_client):
-    _login_admin(admin_only_client)
-
-    create_response = admin_only_client.post(
+def test_admin_can_force_reset_user_password(admin_client):
+    create_response = admin_client.post(
         "/admin/users/new",
         data={
             "email": "reset.target@example.com",
@@ -225,18 +204,18 @@ def test_admin_can_force_reset_user_password(admin_only_client):
     )
     assert create_response.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         user = db.session.execute(select(User).where(User.email == "reset.target@example.com")).scalar_one()
         user_id = user.id
 
-    response = admin_only_client.post(
+    response = admin_client.post(
         f"/admin/users/{user_id}/reset-password",
         data={"temporary_password": "temporary-123"},
         follow_redirects=False,
     )
     assert response.status_code == 302
 
-    with admin_only_client.application.app_context():
+    with admin_client.application.app_context():
         updated = db.session.get(User, user_id)
         assert updated is not None
         assert updated.must_change_password is True
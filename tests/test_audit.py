@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from flask import session
+from sqlalchemy import func, select
+
+from app.audit import log_audit
+from app.extensions import db
+from app.models import AuditLog, Tenant
+
+
+def _tenant_a_id(app):
+    with app.app_context():
+        return db.session.execute(select(Tenant.id).where(Tenant.slug == "tenant-a")).scalar_one()
+
+
+def test_buffered_audit_rows_are_written_on_commit(app):
+    tenant_id = _tenant_a_id(app)
+
+    with app.test_request_context("/"):
+        session["active_tenant_id"] = str(tenant_id)
+        log_audit("TEST_ONE", "tests", None, {"n": 1})
+        log_audit("TEST_TWO", "tests", None)
+        assert db.session.execute(select(func.count(AuditLog.id))).scalar_one() == 0
+        db.session.commit()
+
+        rows = db.session.execute(select(AuditLog).order_by(AuditLog.action.asc())).scalars().all()
+        assert [(row.action, row.tenant_id, row.payload_json) for row in rows] == [
+            ("TEST_ONE", tenant_id, {"n": 1}),
+            ("TEST_TWO", tenant_id, {}),
+        ]
+
+
+def test_buffered_audit_rows_are_discarded_on_rollback(app):
+    tenant_id = _tenant_a_id(app)
+
+    with app.test_request_context("/"):
+        session["active_tenant_id"] = str(tenant_id)
+        log_audit("TEST_DISCARDED", "tests", None)
+        db.session.rollback()
+        db.session.commit()
+
+        assert db.session.execute(select(func.count(AuditLog.id))).scalar_one() == 0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from sqlalchemy import select
+from werkzeug.security import generate_password_hash
 
 from app.extensions import db
 from app.models import User
@@ -62,3 +63,18 @@ def test_login_redirects_to_password_change_when_enforced(client):
     login_response = _login_owner(client)
     assert login_response.status_code == 302
     assert login_response.headers["Location"].endswith("/me/security/password")
+
+
+def test_login_upgrades_legacy_pbkdf2_hash_to_argon2(client):
+    with client.application.app_context():
+        user = db.session.execute(select(User).where(User.email == "owner@example.com")).scalar_one()
+        user.password_hash = generate_password_hash("password123", method="pbkdf2:sha256", salt_length=16)
+        db.session.commit()
+
+    response = _login_owner(client)
+    assert response.status_code == 302
+
+    with client.application.app_context():
+        user = db.session.execute(select(User).where(User.email == "owner@example.com")).scalar_one()
+        assert user.password_hash.startswith("$argon2id$")
+        assert verify_secret(user.password_hash, "password123") is True
@@ -4,9 +4,11 @@ import re
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
+import pytest
 from sqlalchemy import func, select, text
 
 from app.extensions import db
+from app.ids import uuidv7
 from app.models import (
     Employee,
     EmployeeShiftAssignment,
@@ -24,6 +26,7 @@ from app.models import (
     TimeEventSource,
     TimeEventType,
 )
+from app.time_events import bulk_insert_events
 
 
 def _login(client):
@@ -672,3 +675,35 @@ def test_me_leaves_does_not_crash_without_shift_leave_policies(client):
     submit_html = submit.get_data(as_text=True)
     assert "No hay vacaciones o permisos definidos para tu turno actual." in submit_html
 
+
+def test_bulk_insert_events_writes_all_rows_and_skips_replays(app):
+    with app.app_context():
+        employee = db.session.execute(select(Employee).where(Employee.email == "employee@example.com")).scalar_one()
+        before = _event_count()
+        rows = [
+            {
+                "id": uuidv7(),
+                "tenant_id": employee.tenant_id,
+                "employee_id": employee.id,
+                "ts": datetime(2026, 3, 2, 8 + offset, 0, tzinfo=timezone.utc),
+                "type": TimeEventType.IN if offset % 2 == 0 else TimeEventType.OUT,
+                "source": TimeEventSource.WEB,
+                "meta_json": {"via": "kiosk_sync"},
+            }
+            for offset in range(4)
+        ]
+        bulk_insert_events(rows)
+        db.session.commit()
+
+        assert _event_count() == before + 4
+        sources = db.session.execute(
+            select(TimeEvent.source).where(TimeEvent.employee_id == employee.id, TimeEvent.ts >= datetime(2026, 3, 2, tzinfo=timezone.utc))
+        ).scalars().all()
+        assert sources == [TimeEventSource.WEB] * 4
+
+        bulk_insert_events(rows)
+        db.session.commit()
+        assert _event_count() == before + 4
+
+        with pytest.raises(ValueError):
+            bulk_insert_events([{key: value for key, value in rows[0].items() if key != "id"}])
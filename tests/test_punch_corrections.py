@@ -189,12 +189,11 @@ def test_admin_punch_correction_redecide_returns_conflict(admin_only_client):
     assert "La solicitud ya fue decidida." in second_html
 
 
-def test_admin_punch_correction_forbidden_when_target_approver_is_other_user(admin_only_client):
+def test_admin_punch_correction_forbidden_when_target_approver_is_other_user(admin_only_client, admin_account):
     login_response = _login_admin(admin_only_client)
     assert login_response.status_code == 302
 
     with admin_only_client.application.app_context():
-        tenant = db.session.execute(select(Tenant).where(Tenant.slug == "admin-tenant")).scalar_one()
         extra_admin = User(
             id=uuid.uuid4(),
             email=f"target-approver-{uuid.uuid4()}@example.com",
@@ -205,7 +204,7 @@ def test_admin_punch_correction_forbidden_when_target_approver_is_other_user(adm
         db.session.flush()
         db.session.add(
             Membership(
-                tenant_id=tenant.id,
+                tenant_id=admin_account.tenant_id,
                 user_id=extra_admin.id,
                 role=MembershipRole.ADMIN,
                 employee_id=None,
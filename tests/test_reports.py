@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import io
 import json
+import os
+import uuid
 import zipfile
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from alembic import command
+from alembic.config import Config
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.dialects.postgresql import psycopg as psycopg_dialect
 
+from app.blueprints.admin import CONTROL_REPORT_HEADERS, _build_control_report_rows, _control_report_copy_stmt
 from app.extensions import db
 from app.models import (
     Employee,
@@ -18,6 +25,8 @@ from app.models import (
     TimeEventSupersession,
     TimeEventType,
 )
+from app.report_export import stream_csv_copy, to_csv_bytes
+from app.time_events import visible_events_for_report_stmt
 
 
 def _login_owner(client):
@@ -248,3 +257,100 @@ def test_control_report_hides_superseded_original_events(client, app):
     event_ids = {row["event_id"] for row in payload["rows"]}
     assert str(original_event_id) not in event_ids
     assert str(replacement_event_id) in event_ids
+
+
+def test_control_report_copy_stmt_compiles_for_psycopg(app):
+    tenant_id = uuid.uuid4()
+    employee_id = uuid.uuid4()
+    start_utc = datetime(2026, 2, 9, 23, 0, tzinfo=timezone.utc)
+    end_utc = datetime(2026, 2, 10, 22, 59, 59, tzinfo=timezone.utc)
+
+    with app.app_context():
+        stmt = _control_report_copy_stmt(tenant_id, start_utc, end_utc, employee_id)
+    compiled = stmt.compile(dialect=psycopg_dialect.dialect(), compile_kwargs={"render_postcompile": True})
+    sql = str(compiled)
+
+    assert [column.name for column in stmt.selected_columns] == CONTROL_REPORT_HEADERS
+    assert "nullif(employees.name, %(nullif_1)s::VARCHAR) AS employee_name" in sql
+    assert "jsonb_typeof((time_events.meta_json -> %(meta_json_1)s::TEXT))" in sql
+    assert "AS NUMERIC) != %(param_4)s::INTEGER" in sql
+    assert "time_event_supersessions.id IS NULL" in sql
+    assert "time_events.tenant_id = %(tenant_id_1)s::UUID" in sql
+    assert "time_events.employee_id = %(employee_id_1)s::UUID" in sql
+    assert "__[POSTCOMPILE" not in sql
+    assert compiled.params["tenant_id_1"] == tenant_id
+    assert compiled.params["employee_id_1"] == employee_id
+    assert compiled.params["ts_1"] == start_utc
+    assert compiled.params["ts_2"] == end_utc
+    assert compiled.params["timezone_1"] == "UTC"
+    assert compiled.params["timezone_2"] == "Europe/Madrid"
+    assert {compiled.params["jsonb_typeof_4_1"], compiled.params["jsonb_typeof_4_2"]} == {"array", "object"}
+
+
+@pytest.mark.integration
+def test_control_report_copy_matches_python_csv(app):
+    test_database_url = os.getenv("TEST_DATABASE_URL")
+    if not test_database_url:
+        pytest.skip("TEST_DATABASE_URL is not set.")
+
+    alembic_config = Config("alembic.ini")
+    alembic_config.set_main_option("sqlalchemy.url", test_database_url)
+    command.upgrade(alembic_config, "head")
+
+    tenant_id = uuid.uuid4()
+    quoted_employee_id = uuid.uuid4()
+    blank_employee_id = uuid.uuid4()
+    manual_values = [True, 1, "yes", "false", [0], {"by": "admin"}, False, 0, 0.0, "", [], {}, None]
+    start_utc = datetime(2026, 2, 10, 0, 0, tzinfo=timezone.utc)
+    end_utc = datetime(2026, 2, 10, 23, 59, 59, tzinfo=timezone.utc)
+
+    engine = create_engine(test_database_url)
+    try:
+        with engine.connect() as connection, connection.begin() as transaction:
+            connection.exec_driver_sql(f"SET LOCAL app.tenant_id = '{tenant_id}'")
+            connection.execute(insert(Tenant), [{"id": tenant_id, "name": "Copy Tenant", "slug": f"copy-{tenant_id}"}])
+            connection.execute(
+                insert(Employee),
+                [
+                    {"id": quoted_employee_id, "tenant_id": tenant_id, "name": 'Ana "Jefa", Perez\nTurno'},
+                    {"id": blank_employee_id, "tenant_id": tenant_id, "name": ""},
+                ],
+            )
+            connection.execute(
+                insert(TimeEvent),
+                [
+                    {
+                        "tenant_id": tenant_id,
+                        "employee_id": quoted_employee_id if index % 2 else blank_employee_id,
+                        "ts": datetime(2026, 2, 10, 8, index, index, 1000 * index, tzinfo=timezone.utc),
+                        "type": TimeEventType.IN,
+                        "source": TimeEventSource.WEB,
+                        "meta_json": {} if value is None else {"manual": value},
+                    }
+                    for index, value in enumerate(manual_values)
+                ]
+                + [
+                    {
+                        "tenant_id": tenant_id,
+                        "employee_id": quoted_employee_id,
+                        "ts": datetime(2026, 2, 10, 17, 30, tzinfo=timezone.utc),
+                        "type": TimeEventType.OUT,
+                        "source": TimeEventSource.KIOSK,
+                        "meta_json": None,
+                    }
+                ],
+            )
+
+            with app.app_context():
+                copy_stmt = _control_report_copy_stmt(tenant_id, start_utc, end_utc, None)
+                copied = b"".join(stream_csv_copy(connection, copy_stmt, CONTROL_REPORT_HEADERS))
+                event_rows = connection.execute(
+                    visible_events_for_report_stmt(start_utc, end_utc).where(TimeEvent.tenant_id == tenant_id)
+                ).all()
+                expected = to_csv_bytes(*_build_control_report_rows(event_rows))
+            transaction.rollback()
+    finally:
+        engine.dispose()
+
+    assert len(event_rows) == len(manual_values) + 1
+    assert copied == expected
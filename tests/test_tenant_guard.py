@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+from flask import session
+from flask_login import login_user
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
 import app.tenant as tenant_module
+from app.extensions import db
+from app.models import User
 
 
 def _login(client):
@@ -46,3 +52,47 @@ def test_select_tenant_page_handles_membership_lookup_errors(client, monkeypatch
 
     page = client.get("/select-tenant", follow_redirects=False)
     assert page.status_code == 200
+
+
+def test_current_membership_is_cached_per_user_and_tenant(admin_only_client, admin_account, monkeypatch):
+    app = admin_only_client.application
+    with app.app_context():
+        user = db.session.get(User, admin_account.user_id)
+
+    executed = []
+    original_execute = db.session.execute
+
+    def _counting_execute(*args, **kwargs):
+        executed.append(args[0])
+        return original_execute(*args, **kwargs)
+
+    with app.test_request_context("/"):
+        login_user(user)
+        session["active_tenant_id"] = str(admin_account.tenant_id)
+        monkeypatch.setattr(db.session, "execute", _counting_execute)
+
+        first = tenant_module.current_membership()
+        assert first is not None
+        assert tenant_module.current_membership() is first
+        assert len(executed) == 1
+
+        tenant_module.clear_membership_cache()
+        assert tenant_module.current_membership() is first
+        assert len(executed) == 2
+
+
+def test_healthz_checks_database_without_login(client):
+    response = client.get("/healthz")
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "ok"}
+
+
+def test_healthz_reports_unavailable_when_pool_is_exhausted(client, monkeypatch):
+    def _pool_timeout(*_args, **_kwargs):
+        raise PoolTimeoutError("QueuePool limit of size 5 overflow 0 reached")
+
+    monkeypatch.setattr(db.session, "execute", _pool_timeout)
+
+    response = client.get("/healthz")
+    assert response.status_code == 503
+    assert response.get_json() == {"status": "unavailable"}